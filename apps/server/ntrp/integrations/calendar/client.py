@@ -1,13 +1,18 @@
+import heapq
 from collections.abc import Callable
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
+from functools import cache
 from pathlib import Path
 from typing import Any
 
 from google.auth.exceptions import RefreshError
-from googleapiclient.discovery import build
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build, build_from_document
 
+from ntrp.integrations.google_auth.accounts import AccountIndex, map_accounts
 from ntrp.integrations.google_auth.auth import (
     SCOPES_CALENDAR,
+    discover_gmail_tokens,
     get_google_credentials,
     has_scope,
 )
@@ -15,68 +20,101 @@ from ntrp.logging import get_logger
 from ntrp.search.types import RawItem
 from ntrp.settings import NTRP_DIR
 
+try:
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:
+    _parse_iso_datetime = datetime.fromisoformat
+
+# Partial-response masks: only what _parse_event and the tool replies read.
+_EVENT_LIST_FIELDS = (
+    "items(id,summary,description,location,start,end,attendees(email),organizer(email),status,htmlLink)"
+)
+
+
+@cache
+def _calendar_discovery_doc() -> str | None:
+    # The bundled static doc is ~130KB; read it once per process rather than
+    # once per account service.
+    return discovery_cache.get_static_doc("calendar", "v3")
+
 
 def parse_event_datetime(dt_obj: dict) -> datetime | None:
     if "dateTime" in dt_obj:
-        dt_str = dt_obj["dateTime"]
         try:
-            return datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
+            # ciso8601 when installed, else fromisoformat (accepts "Z" since 3.11).
+            return _parse_iso_datetime(dt_obj["dateTime"])
         except Exception:
             return None
     elif "date" in dt_obj:
         # All-day event (date only)
         try:
-            return datetime.strptime(dt_obj["date"], "%Y-%m-%d").replace(tzinfo=UTC)
+            day = date.fromisoformat(dt_obj["date"])
+            return datetime(day.year, day.month, day.day, tzinfo=UTC)
         except Exception:
             return None
     return None
 
 
+def _event_iso(dt_obj: dict, parsed: datetime | None) -> str:
+    # The API already sends offset dateTimes as "YYYY-MM-DDTHH:MM:SS+HH:MM",
+    # exactly what isoformat() would rebuild; reuse the string when it has that
+    # canonical shape (not "Z", no fractional seconds).
+    raw = dt_obj.get("dateTime")
+    if parsed is not None and raw and len(raw) == 25 and raw[19] in "+-":
+        return raw
+    return parsed.isoformat() if parsed else ""
+
+
+def _fmt_date(dt: datetime) -> str:
+    # f-string padding over the fields is cheaper than strftime's format walk.
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+
+
+def _fmt_hm(dt: datetime) -> str:
+    return f"{dt.hour:02d}:{dt.minute:02d}"
+
+
 def format_event_time(start: datetime | None, end: datetime | None, is_all_day: bool) -> str:
     if not start:
         return ""
 
     if is_all_day:
         if end and (end - start).days > 1:
-            return f"{start.strftime('%Y-%m-%d')} - {end.strftime('%Y-%m-%d')}"
-        return start.strftime("%Y-%m-%d") + " (all day)"
+            return f"{_fmt_date(start)} - {_fmt_date(end)}"
+        return f"{_fmt_date(start)} (all day)"
 
     local_start = start.astimezone() if start.tzinfo is not None else start
-    date_str = local_start.strftime("%Y-%m-%d")
-    time_str = local_start.strftime("%H:%M")
     if end:
         local_end = end.astimezone() if end.tzinfo is not None else end
-        time_str += f" - {local_end.strftime('%H:%M')}"
-    return f"{date_str} {time_str}"
+        return f"{_fmt_date(local_start)} {_fmt_hm(local_start)} - {_fmt_hm(local_end)}"
+    return f"{_fmt_date(local_start)} {_fmt_hm(local_start)}"
 
 
-def _apply_time_update(
-    event: dict,
-    start: datetime | None,
-    end: datetime | None,
-    all_day: bool | None,
-) -> None:
-    if start is None and all_day is None:
-        return
+def _time_payload(dt: datetime, all_day: bool) -> dict[str, str | None]:
+    if all_day:
+        return {"date": _fmt_date(dt)}
+    return {"dateTime": dt.isoformat()}
 
-    is_all_day = all_day if all_day is not None else "date" in event.get("start", {})
 
+# Patch bodies merge into the stored event, so the unused date/dateTime variant
+# is nulled explicitly; otherwise switching timed <-> all-day would leave both
+# set. The kind is decided once by the caller, so each helper is straight-line.
+def _apply_all_day_update(patch: dict, start: datetime | None, end: datetime | None) -> None:
     if start is not None:
-        if is_all_day:
-            event["start"] = {"date": start.strftime("%Y-%m-%d")}
-        else:
-            event["start"] = {"dateTime": start.isoformat()}
+        patch["start"] = {"date": _fmt_date(start), "dateTime": None}
+        if end is None:
+            end = start + timedelta(days=1)
+    if end is not None:
+        patch["end"] = {"date": _fmt_date(end), "dateTime": None}
+
 
+def _apply_timed_update(patch: dict, start: datetime | None, end: datetime | None) -> None:
+    if start is not None:
+        patch["start"] = {"dateTime": start.isoformat(), "date": None}
+        if end is None:
+            end = start + timedelta(hours=1)
     if end is not None:
-        if is_all_day:
-            event["end"] = {"date": end.strftime("%Y-%m-%d")}
-        else:
-            event["end"] = {"dateTime": end.isoformat()}
-    elif start is not None:
-        if is_all_day:
-            event["end"] = {"date": (start + timedelta(days=1)).strftime("%Y-%m-%d")}
-        else:
-            event["end"] = {"dateTime": (start + timedelta(hours=1)).isoformat()}
+        patch["end"] = {"dateTime": end.isoformat(), "date": None}
 
 
 class GoogleCalendar:
@@ -91,9 +129,9 @@ class GoogleCalendar:
         if token_path:
             self.token_path = token_path
         else:
-            gmail_tokens = list(NTRP_DIR.glob("gmail_token*.json")) if NTRP_DIR.exists() else []
+            gmail_tokens = discover_gmail_tokens()
             if gmail_tokens:
-                self.token_path = sorted(gmail_tokens)[0]
+                self.token_path = gmail_tokens[0]
             else:
                 self.token_path = NTRP_DIR / "calendar_token.json"
 
@@ -119,7 +157,13 @@ class GoogleCalendar:
     def _get_service(self):
         if self._service is None:
             creds = self._get_credentials()
-            self._service = build("calendar", "v3", credentials=creds)
+            # Each service gets its own httplib2.Http (not thread-safe, so never
+            # shared across instances); it still keeps the connection alive.
+            doc = _calendar_discovery_doc()
+            if doc is None:
+                self._service = build("calendar", "v3", credentials=creds)
+            else:
+                self._service = build_from_document(doc, credentials=creds)
         return self._service
 
     def get_email_address(self) -> str:
@@ -127,7 +171,7 @@ class GoogleCalendar:
             return self._email_address
         try:
             service = self._get_service()
-            calendar = service.calendars().get(calendarId="primary").execute()
+            calendar = service.calendars().get(calendarId="primary", fields="id").execute()
             self._email_address = calendar.get("id", "")
             return self._email_address
         except Exception:
@@ -174,8 +218,8 @@ class GoogleCalendar:
             updated_at=created_at,
             metadata={
                 "calendar_id": event.get("organizer", {}).get("email", "primary"),
-                "start": start.isoformat() if start else "",
-                "end": end.isoformat() if end else "",
+                "start": _event_iso(start_obj, start),
+                "end": _event_iso(end_obj, end),
                 "is_all_day": is_all_day,
                 "location": location,
                 "status": event.get("status", ""),
@@ -199,6 +243,7 @@ class GoogleCalendar:
                 maxResults=limit,
                 singleEvents=True,
                 orderBy="startTime",
+                fields=_EVENT_LIST_FIELDS,
             )
             .execute()
         )
@@ -221,6 +266,7 @@ class GoogleCalendar:
                 maxResults=limit,
                 singleEvents=True,
                 orderBy="startTime",
+                fields=_EVENT_LIST_FIELDS,
             )
             .execute()
         )
@@ -245,15 +291,10 @@ class GoogleCalendar:
 
         event_body: dict[str, Any] = {
             "summary": summary,
+            "start": _time_payload(start, all_day),
+            "end": _time_payload(end, all_day),
         }
 
-        if all_day:
-            event_body["start"] = {"date": start.strftime("%Y-%m-%d")}
-            event_body["end"] = {"date": end.strftime("%Y-%m-%d")}
-        else:
-            event_body["start"] = {"dateTime": start.isoformat()}
-            event_body["end"] = {"dateTime": end.isoformat()}
-
         if description:
             event_body["description"] = description
         if location:
@@ -267,6 +308,7 @@ class GoogleCalendar:
                 .insert(
                     calendarId="primary",
                     body=event_body,
+                    fields="id,htmlLink",
                 )
                 .execute()
             )
@@ -303,36 +345,32 @@ class GoogleCalendar:
         service = self._get_service()
 
         try:
-            # Get existing event
-            event = (
-                service.events()
-                .get(
-                    calendarId="primary",
-                    eventId=event_id,
-                )
-                .execute()
-            )
-
-            # Update fields if provided
+            patch: dict[str, Any] = {}
             if summary is not None:
-                event["summary"] = summary
+                patch["summary"] = summary
             if description is not None:
-                event["description"] = description
+                patch["description"] = description
             if location is not None:
-                event["location"] = location
+                patch["location"] = location
             if attendees is not None:
-                event["attendees"] = [{"email": email} for email in attendees]
+                patch["attendees"] = [{"email": email} for email in attendees]
 
-            # Handle time updates
-            _apply_time_update(event, start, end, all_day)
+            if start is not None or all_day is not None:
+                is_all_day = all_day
+                if is_all_day is None:
+                    # Only the start's shape is needed to keep the event's kind.
+                    current = service.events().get(calendarId="primary", eventId=event_id, fields="start").execute()
+                    is_all_day = "date" in current.get("start", {})
+                apply = _apply_all_day_update if is_all_day else _apply_timed_update
+                apply(patch, start, end)
 
-            # Update the event
             updated = (
                 service.events()
-                .update(
+                .patch(
                     calendarId="primary",
                     eventId=event_id,
-                    body=event,
+                    body=patch,
+                    fields="summary,htmlLink",
                 )
                 .execute()
             )
@@ -358,6 +396,7 @@ class GoogleCalendar:
                 maxResults=limit,
                 singleEvents=True,
                 orderBy="startTime",
+                fields=_EVENT_LIST_FIELDS,
                 q=query,
             )
             .execute()
@@ -369,6 +408,8 @@ class GoogleCalendar:
 
 _logger = get_logger(__name__)
 
+_EVENT_OWNER_LIMIT = 10_000
+
 
 class MultiCalendarSource:
     name = "calendar"
@@ -388,6 +429,10 @@ class MultiCalendarSource:
                 self.sources.append(src)
             except Exception as e:
                 self._errors[token_path.name] = str(e)
+        self._accounts = AccountIndex(self.sources)
+        # event id -> account it was last seen on, so delete/update go straight
+        # to the owning calendar instead of probing every account.
+        self._event_owner: dict[str, GoogleCalendar] = {}
 
     @property
     def errors(self) -> dict[str, str]:
@@ -403,18 +448,34 @@ class MultiCalendarSource:
         return {"accounts": self.list_accounts()}
 
     def list_accounts(self) -> list[str]:
-        accounts: list[str] = []
-        for src in self.sources:
-            email = src.get_email_address()
-            if email:
-                accounts.append(email)
-        return accounts
+        return self._accounts.list_accounts()
+
+    def _remember_owners(self, batches: list[list[RawItem]]) -> None:
+        # Runs on the calling thread once every account has answered. An event
+        # shared between accounts belongs to the first in source order, the
+        # same account sequential probing would reach first.
+        owners: dict[str, GoogleCalendar] = {}
+        for src, items in zip(self.sources, batches):
+            for item in items:
+                owners.setdefault(item.source_id, src)
+        if len(self._event_owner) + len(owners) > _EVENT_OWNER_LIMIT:
+            self._event_owner.clear()
+        self._event_owner.update(owners)
+
+    def _dispatch(self, event_id: str, fn: Callable[[GoogleCalendar], str]) -> str:
+        owner = self._event_owner.get(event_id)
+        candidates = self.sources if owner is None else [owner, *(s for s in self.sources if s is not owner)]
+        for src in candidates:
+            result = fn(src)
+            if not result.startswith("Error"):
+                self._event_owner[event_id] = src
+                return result
+        return f"Error: event not found: {event_id}"
 
     def _collect(self, fn: Callable[[GoogleCalendar], list[RawItem]], limit: int) -> list[RawItem]:
-        items: list[RawItem] = []
-        for src in self.sources:
+        def fetch(src: GoogleCalendar) -> list[RawItem]:
             try:
-                items.extend(fn(src))
+                return fn(src)
             except RefreshError as e:
                 key = src.get_email_address() or src.token_path.name
                 _logger.warning("Calendar auth failed for %s: %s", key, e)
@@ -422,8 +483,15 @@ class MultiCalendarSource:
             except Exception as e:
                 key = src.get_email_address() or src.token_path.name
                 _logger.warning("Calendar failed for %s: %s", key, e)
-        items.sort(key=lambda x: x.metadata.get("start", ""))
-        return items[:limit]
+            return []
+
+        batches = map_accounts(fetch, self.sources)
+        self._remember_owners(batches)
+        # Rank by the parsed start instant: the ISO strings don't sort
+        # chronologically across offsets, "Z" suffixes or all-day dates, so the
+        # per-account startTime order can't be k-way merged on them either.
+        items = [item for batch in batches for item in batch]
+        return heapq.nsmallest(limit, items, key=lambda x: x.created_at)
 
     def get_upcoming(self, days: int = 7, limit: int = 20) -> list[RawItem]:
         per = max(limit // len(self.sources), 5) if self.sources else limit
@@ -458,19 +526,17 @@ class MultiCalendarSource:
                 )
             return "Error: no calendar accounts available"
 
-        account_lower = account.lower().strip()
-        for src in self.sources:
-            email = src.get_email_address().lower()
-            if email == account_lower:
-                return src.create_event(
-                    summary=summary,
-                    start=start,
-                    end=end,
-                    description=description,
-                    location=location,
-                    attendees=attendees,
-                    all_day=all_day,
-                )
+        src = self._accounts.by_email().get(account.lower().strip())
+        if src is not None:
+            return src.create_event(
+                summary=summary,
+                start=start,
+                end=end,
+                description=description,
+                location=location,
+                attendees=attendees,
+                all_day=all_day,
+            )
 
         accounts = self.list_accounts()
         if accounts:
@@ -478,11 +544,9 @@ class MultiCalendarSource:
         return "Error: no Calendar accounts available"
 
     def delete_event(self, event_id: str) -> str:
-        for src in self.sources:
-            result = src.delete_event(event_id)
-            if not result.startswith("Error"):
-                return result
-        return f"Error: event not found: {event_id}"
+        result = self._dispatch(event_id, lambda src: src.delete_event(event_id))
+        self._event_owner.pop(event_id, None)
+        return result
 
     def update_event(
         self,
@@ -495,8 +559,9 @@ class MultiCalendarSource:
         attendees: list[str] | None = None,
         all_day: bool | None = None,
     ) -> str:
-        for src in self.sources:
-            result = src.update_event(
+        return self._dispatch(
+            event_id,
+            lambda src: src.update_event(
                 event_id=event_id,
                 summary=summary,
                 start=start,
@@ -505,10 +570,8 @@ class MultiCalendarSource:
                 location=location,
                 attendees=attendees,
                 all_day=all_day,
-            )
-            if not result.startswith("Error"):
-                return result
-        return f"Error: event not found: {event_id}"
+            ),
+        )
 
     def search(self, query: str, limit: int = 20) -> list[RawItem]:
         per = max(limit // len(self.sources), 5) if self.sources else limit
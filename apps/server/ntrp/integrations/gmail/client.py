@@ -1,19 +1,29 @@
-import base64
+import heapq
+import json
+import os
 import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from contextlib import suppress
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta, timezone
 from email.header import decode_header as decode_rfc2047
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.utils import parsedate_to_datetime
+from functools import cache
 from html import unescape
 from pathlib import Path
 from typing import Any
 
-import markdown
 from googleapiclient.discovery import build
+from googleapiclient.model import JsonModel
 
 from ntrp.core.prompts import env
+from ntrp.integrations.google_auth.accounts import AccountIndex, map_accounts
 from ntrp.integrations.google_auth.auth import (
     SCOPES_ALL,
     SCOPES_GMAIL_SEND,
@@ -24,6 +34,200 @@ from ntrp.logging import get_logger
 from ntrp.search.types import RawItem
 from ntrp.settings import NTRP_DIR
 
+try:
+    from pybase64 import b64encode_as_string, urlsafe_b64decode
+
+    def _urlsafe_b64encode_str(data: bytes) -> str:
+        return b64encode_as_string(data, altchars=b"-_")
+except ImportError:
+    from base64 import urlsafe_b64decode, urlsafe_b64encode
+
+    def _urlsafe_b64encode_str(data: bytes) -> str:
+        # base64 output is ASCII by construction; skip the UTF-8 decoder
+        return urlsafe_b64encode(data).decode("ascii")
+
+
+try:
+    from orjson import JSONDecodeError as _OrjsonDecodeError
+    from orjson import loads as _orjson_loads
+
+    class _OrjsonModel(JsonModel):
+        """JsonModel that parses responses (incl. batch parts) with orjson."""
+
+        def deserialize(self, content):
+            try:
+                body = _orjson_loads(content)
+            except _OrjsonDecodeError:
+                return super().deserialize(content)
+            if self._data_wrapper and "data" in body:
+                body = body["data"]
+            return body
+
+    _JSON_MODEL: JsonModel = _OrjsonModel()
+except ImportError:
+    _JSON_MODEL = JsonModel()
+
+
+# Gmail caps batch requests at 100 calls and advises <= 50 to avoid rate limits.
+_METADATA_BATCH_SIZE = 50
+# Full messages can carry multi-MB bodies, so they get a much smaller cap and a
+# separate cache: a burst of reads can't evict the cheap metadata entries.
+_METADATA_CACHE_SIZE = 2048
+_FULL_CACHE_SIZE = 128
+# Partial response for reads: the top-level headers and the MIME tree are all
+# _parse_full_message uses (sub-parts come back whole).
+_FULL_MESSAGE_FIELDS = "id,threadId,snippet,internalDate,labelIds,payload(headers(name,value),mimeType,body/data,parts)"
+# On-disk L2 behind the LRUs so a restart doesn't re-fetch every message. Bodies
+# and headers never change, but labels (read/starred) do, so rows expire.
+MESSAGE_CACHE_PATH = NTRP_DIR / "emails_cache.db"
+_MESSAGE_CACHE_TTL_SECONDS = 24 * 60 * 60
+_MESSAGE_CACHE_MAX_ROWS = 20_000
+
+
+class _LRUCache:
+    """Small least-recently-used map of message id -> raw Gmail message."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, dict] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> dict | None:
+        value = self._data.get(key)
+        if value is not None:
+            with suppress(KeyError):  # evicted concurrently by another fetch
+                self._data.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: dict) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+class _MessageStore:
+    """SQLite-backed message cache shared by all accounts, keyed by ``<account>:<kind>:<id>``.
+
+    Best-effort: any sqlite error disables the store and callers fall back to the API.
+    """
+
+    def __init__(self, path: Path, account: str):
+        self.path = path
+        self._prefix = f"{account}:"
+        self._conn: sqlite3.Connection | None = None
+        self._disabled = False
+        self._purged_at = 0
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self._conn is None and not self._disabled:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                # Rows hold full message bodies: keep the file (and the WAL/SHM
+                # files sqlite derives from its mode) private to the user.
+                os.close(os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600))
+                self.path.chmod(0o600)
+                conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute("CREATE TABLE IF NOT EXISTS emails (key TEXT PRIMARY KEY, json BLOB, fetched_at INTEGER)")
+                conn.execute("CREATE INDEX IF NOT EXISTS emails_fetched_at ON emails (fetched_at)")
+                self._conn = conn
+                self._purge(conn)
+            except (OSError, sqlite3.Error) as e:
+                self._disable(e)
+        return self._conn
+
+    def _purge(self, conn: sqlite3.Connection) -> None:
+        """Drop expired rows and cap the table at the newest _MESSAGE_CACHE_MAX_ROWS."""
+        now = int(time.time())
+        conn.execute("DELETE FROM emails WHERE fetched_at < ?", (now - _MESSAGE_CACHE_TTL_SECONDS,))
+        conn.execute(
+            "DELETE FROM emails WHERE key IN (SELECT key FROM emails ORDER BY fetched_at DESC LIMIT -1 OFFSET ?)",
+            (_MESSAGE_CACHE_MAX_ROWS,),
+        )
+        self._purged_at = now
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                with suppress(sqlite3.Error):
+                    self._conn.close()
+                self._conn = None
+
+    def clear(self) -> None:
+        """Delete every row stored for this account (all kinds)."""
+        if not self.path.exists():
+            return
+        # Keys are "<account>:...", and ";" sorts right after ":", so this
+        # range is exactly the account's rows (and uses the primary key).
+        upper = self._prefix[:-1] + ";"
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute("DELETE FROM emails WHERE key >= ? AND key < ?", (self._prefix, upper))
+            except sqlite3.Error as e:
+                self._disable(e)
+
+    def _disable(self, e: Exception) -> None:
+        _logger.warning("Gmail message cache unavailable (%s): %s", self.path, e)
+        self._disabled = True
+        if self._conn is not None:
+            with suppress(sqlite3.Error):
+                self._conn.close()
+            self._conn = None
+
+    def get_many(self, kind: str, msg_ids: list[str]) -> dict[str, dict]:
+        if not msg_ids:
+            return {}
+        prefix = f"{self._prefix}{kind}:"
+        keys = [prefix + msg_id for msg_id in msg_ids]
+        min_fetched_at = int(time.time()) - _MESSAGE_CACHE_TTL_SECONDS
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return {}
+            try:
+                rows = conn.execute(
+                    f"SELECT key, json FROM emails WHERE fetched_at >= ? AND key IN ({','.join('?' * len(keys))})",
+                    (min_fetched_at, *keys),
+                ).fetchall()
+            except sqlite3.Error as e:
+                self._disable(e)
+                return {}
+        return {key[len(prefix) :]: json.loads(data) for key, data in rows}
+
+    def put_many(self, kind: str, messages: dict[str, dict]) -> None:
+        if not messages:
+            return
+        prefix = f"{self._prefix}{kind}:"
+        now = int(time.time())
+        rows = [(prefix + msg_id, json.dumps(msg), now) for msg_id, msg in messages.items()]
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.executemany("INSERT OR REPLACE INTO emails VALUES (?, ?, ?)", rows)
+                if now - self._purged_at >= _MESSAGE_CACHE_TTL_SECONDS // 24:  # long-running sessions: hourly
+                    self._purge(conn)
+            except sqlite3.Error as e:
+                self._disable(e)
+
+
+def clear_message_cache(token_path: Path) -> None:
+    """Drop a removed account's messages from the on-disk cache."""
+    store = _MessageStore(MESSAGE_CACHE_PATH, token_path.name)
+    try:
+        store.clear()
+    finally:
+        store.close()
+
 
 @dataclass(frozen=True)
 class SourceItem:
@@ -122,60 +326,132 @@ EMAIL_HTML_TEMPLATE = env.from_string("""<!DOCTYPE html>
 </html>""")
 
 
+@cache
+def _markdown_converter():
+    # markdown (+ its extensions) costs ~25ms to import and is only needed for
+    # HTML sends, so keep it off the integration import path. Building the
+    # converter loads every extension; build it once and reset() between uses.
+    import markdown
+
+    # Convert markdown to HTML with common extensions
+    return markdown.Markdown(
+        extensions=[
+            "extra",  # tables, fenced code, etc.
+            "nl2br",  # newline to <br>
+            "sane_lists",  # better list handling
+            "codehilite",  # code highlighting
+        ]
+    )
+
+
+# A Markdown instance keeps per-document state between reset() and convert().
+_markdown_lock = threading.Lock()
+
+
 def decode_base64_body(data: str) -> str:
+    if not data:
+        return ""
     try:
-        decoded = base64.urlsafe_b64decode(data)
-        return decoded.decode("utf-8", errors="replace")
-    except Exception:
-        return ""  # Invalid base64 data - return empty string
+        # Restore stripped padding so unpadded base64url decodes instead of raising
+        decoded = urlsafe_b64decode(data + "=" * (-len(data) % 4))
+    except ValueError:
+        return ""  # Invalid base64 data (binascii.Error) - return empty string
+    return decoded.decode("utf-8", errors="replace")
 
 
-def find_email_parts(part: dict[str, Any]) -> tuple[str, str]:
+def find_email_parts(part: dict[str, Any], html_fallback_only: bool = False) -> tuple[str, str]:
     """
-    Recursively extract text/plain and text/html from MIME structure.
+    Extract text/plain and text/html from MIME structure, in document order.
+
+    With html_fallback_only, HTML parts are decoded only when the plain text is
+    blank (otherwise "" is returned for html), since callers then discard it.
 
     Returns:
         Tuple of (plain_text, html_text)
     """
-    plain_content = ""
-    html_content = ""
-    mime_type = part.get("mimeType", "")
-
-    if mime_type.startswith("multipart/"):
-        for sub_part in part.get("parts", []):
-            plain, html = find_email_parts(sub_part)
-            plain_content += plain
-            html_content += html
-    elif mime_type == "text/plain":
-        body = part.get("body", {})
-        if "data" in body:
-            plain_content = decode_base64_body(body["data"])
-    elif mime_type == "text/html":
-        body = part.get("body", {})
-        if "data" in body:
-            html_content = decode_base64_body(body["data"])
-
-    return plain_content, html_content
+    plain_chunks: list[str] = []
+    html_data: list[str] = []
+    stack = [part]
+
+    while stack:
+        part = stack.pop()
+        mime_type = part.get("mimeType", "")
+
+        if mime_type.startswith("multipart/"):
+            stack.extend(reversed(part.get("parts", [])))
+        elif mime_type == "text/plain":
+            body = part.get("body", {})
+            if "data" in body:
+                plain_chunks.append(decode_base64_body(body["data"]))
+        elif mime_type == "text/html":
+            body = part.get("body", {})
+            if "data" in body:
+                html_data.append(body["data"])
+
+    plain = "".join(plain_chunks)
+    if html_fallback_only and plain and not plain.isspace():
+        return plain, ""
+    return plain, "".join(decode_base64_body(data) for data in html_data)
+
+
+_BLOCK_END_RE = {
+    "script": re.compile(r"</script>", re.I),
+    "style": re.compile(r"</style>", re.I),
+}
+_TAB_TO_SPACE = str.maketrans("\t", " ")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
+def _strip_tags(html: str) -> str:
+    """Drop tags and script/style blocks in one scan; <br> and </p> become newlines."""
+    out: list[str] = []
+    i = 0
+    while (lt := html.find("<", i)) >= 0:
+        gt = html.find(">", lt + 1)
+        if gt < 0:
+            break
+        out.append(html[i:lt])
+        if gt == lt + 1:
+            # "<>" is not a tag; keep the "<" and rescan from the ">"
+            out.append("<")
+            i = gt
+            continue
+        i = gt + 1
+        name = html[lt + 1 : lt + 7].lower()
+        block = "script" if name == "script" else "style" if name[:5] == "style" else None
+        if block:
+            end = _BLOCK_END_RE[block].search(html, i)
+            if end:
+                i = end.end()
+            continue
+        # Only </p> and <br> emit anything; don't copy the body of other tags
+        if html[lt + 1] not in "/bB":
+            continue
+        inner = html[lt + 1 : gt].lower()
+        if inner == "/p":
+            out.append("\n")
+        elif inner[:2] == "br":
+            rest = inner[2:-1] if inner[-1] == "/" else inner[2:]
+            if not rest or rest.isspace():
+                out.append("\n")
+    if not out:
+        return html  # no tags at all
+    out.append(html[i:])
+    return "".join(out)
 
 
 def html_to_plain(html: str) -> str:
     if not html:
         return ""
 
-    text = html
-    # Remove script/style blocks
-    text = re.sub(r"<script[^>]*>.*?</script>", "", text, flags=re.DOTALL | re.I)
-    text = re.sub(r"<style[^>]*>.*?</style>", "", text, flags=re.DOTALL | re.I)
-    # Convert br/p to newlines
-    text = re.sub(r"<br\s*/?>", "\n", text, flags=re.I)
-    text = re.sub(r"</p>", "\n", text, flags=re.I)
-    # Strip remaining tags
-    text = re.sub(r"<[^>]+>", "", text)
-    # Unescape HTML entities
-    text = unescape(text)
-    # Normalize whitespace
-    text = re.sub(r"[ \t]+", " ", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _strip_tags(html)
+    if "&" in text:
+        text = unescape(text)
+    # Normalize whitespace: tabs -> spaces, then collapse space runs by dropping
+    # the empty fields between them (edge spaces go too; strip() below would
+    # remove them anyway).
+    text = " ".join(filter(None, text.translate(_TAB_TO_SPACE).split(" ")))
+    text = _BLANK_LINES_RE.sub("\n\n", text)
     return text.strip()
 
 
@@ -183,6 +459,8 @@ def decode_email_header(value: str | None) -> str:
     """Decode RFC-2047 encoded headers (=?utf-8?Q?...?=)."""
     if not value:
         return ""
+    if "=?" not in value:
+        return value.strip()  # no encoded-words; decode_rfc2047 would return it as-is
 
     parts = decode_rfc2047(value)
     decoded = []
@@ -193,19 +471,53 @@ def decode_email_header(value: str | None) -> str:
     return "".join(decoded).strip()
 
 
-def extract_headers(headers: list[dict]) -> dict[str, str]:
-    """Extract headers into a dict with lowercase keys."""
-    return {h.get("name", "").lower(): h.get("value", "") for h in headers}
+_WANTED_HEADERS = frozenset({"from", "to", "subject", "date"})
+
 
+def extract_headers(headers: list[dict], wanted: frozenset[str] = _WANTED_HEADERS) -> dict[str, str]:
+    """Extract the wanted headers into a dict with lowercase keys."""
+    out: dict[str, str] = {}
+    for h in headers:
+        name = h.get("name", "").lower()
+        if name in wanted:
+            out[name] = h.get("value", "")
+    return out
+
+
+_MONTHS = {
+    m: i for i, m in enumerate(("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"), 1)
+}
+_OFFSETS: dict[str, timezone] = {}
+
+
+def _parse_common_date(value: str) -> datetime | None:
+    """Fast path for the canonical "Sat, 16 May 2026 09:30:00 +0200" shape.
+
+    Returns None for anything else so the caller can use the full RFC 2822 parser.
+    """
+    parts = value.split()
+    if parts and parts[0].endswith(","):
+        parts = parts[1:]
+    # Allow a trailing zone comment such as "(UTC)"
+    if len(parts) == 5 or (len(parts) == 6 and parts[5].startswith("(")):
+        day, mon, year, hms, offset = parts[:5]
+    else:
+        return None
+    month = _MONTHS.get(mon)
+    if month is None or len(year) != 4 or len(hms) != 8 or len(offset) != 5 or offset[0] not in "+-":
+        return None
+    tz = _OFFSETS.get(offset)
+    if tz is None:
+        minutes = int(offset[1:3]) * 60 + int(offset[3:5])
+        tz = _OFFSETS.setdefault(offset, timezone(timedelta(minutes=-minutes if offset[0] == "-" else minutes)))
+    return datetime(int(year), month, int(day), int(hms[0:2]), int(hms[3:5]), int(hms[6:8]), tzinfo=tz)
 
-def parse_email_date(headers: list[dict], fallback_ms: int) -> datetime:
-    """Parse email date from headers or fallback to internalDate."""
-    header_dict = extract_headers(headers)
-    date_str = header_dict.get("date")
 
+def parse_email_date(date_str: str | None, fallback_ms: int) -> datetime:
+    """Parse the Date header value or fallback to internalDate."""
     if date_str:
         try:
-            parsed = parsedate_to_datetime(date_str)
+            parsed = _parse_common_date(date_str) or parsedate_to_datetime(date_str)
             if parsed.tzinfo is None:
                 parsed = parsed.replace(tzinfo=UTC)
             return parsed
@@ -232,25 +544,31 @@ class GmailSource:
 
         self._service = None
         self._creds = None
-        self._emails_cache: dict[str, dict] = {}  # id -> raw email
+        self._metadata_cache = _LRUCache(_METADATA_CACHE_SIZE)
+        self._full_cache = _LRUCache(_FULL_CACHE_SIZE)
+        self._store = _MessageStore(MESSAGE_CACHE_PATH, self.token_path.name)
         self._email_address: str | None = None
+        self._send_scope: bool | None = None  # reset whenever _creds is replaced
 
     def _get_credentials(self):
         if self._creds is None or not self._creds.valid:
             self._creds = get_google_credentials(self.token_path, scopes=SCOPES_ALL)
+            self._send_scope = None
         return self._creds
 
     def has_send_scope(self) -> bool:
         try:
             creds = self._get_credentials()
-            return has_scope(creds, SCOPES_GMAIL_SEND[0])
         except Exception:
             return False  # Token invalid or network error - assume no send scope
+        if self._send_scope is None:
+            self._send_scope = has_scope(creds, SCOPES_GMAIL_SEND[0])
+        return self._send_scope
 
     def _get_service(self):
         if self._service is None:
             creds = self._get_credentials()
-            self._service = build("gmail", "v1", credentials=creds)
+            self._service = build("gmail", "v1", credentials=creds, model=_JSON_MODEL)
         return self._service
 
     def get_email_address(self) -> str:
@@ -296,7 +614,7 @@ class GmailSource:
             if from_email:
                 message["from"] = from_email
 
-        raw = base64.urlsafe_b64encode(message.as_bytes()).decode("utf-8")
+        raw = _urlsafe_b64encode_str(message.as_bytes())
 
         try:
             service = self._get_service()
@@ -315,51 +633,81 @@ class GmailSource:
             return f"Error sending email: {e}"
 
     def _markdown_to_html(self, markdown_text: str) -> str:
-        # Convert markdown to HTML with common extensions
-        md = markdown.Markdown(
-            extensions=[
-                "extra",  # tables, fenced code, etc.
-                "nl2br",  # newline to <br>
-                "sane_lists",  # better list handling
-                "codehilite",  # code highlighting
-            ]
-        )
-        content = md.convert(markdown_text)
+        md = _markdown_converter()
+        with _markdown_lock:
+            content = md.reset().convert(markdown_text)
 
         return EMAIL_HTML_TEMPLATE.render(content=content)
 
-    def _fetch_message_metadata(self, msg_id: str) -> dict | None:
-        cache_key = f"meta:{msg_id}"
-        if cache_key in self._emails_cache:
-            return self._emails_cache[cache_key]
+    def _fetch_messages_metadata(self, msg_ids: list[str]) -> list[dict]:
+        """Fetch metadata for many messages, batching uncached ids into a few HTTP calls."""
+        found: dict[str, dict] = {}
+        missing: list[str] = []
+        for msg_id in msg_ids:
+            cached = self._metadata_cache.get(msg_id)
+            if cached is not None:
+                found[msg_id] = cached
+            elif msg_id not in missing:
+                missing.append(msg_id)
+
+        if missing:
+            for msg_id, msg in self._store.get_many("meta", missing).items():
+                self._metadata_cache.put(msg_id, msg)
+                found[msg_id] = msg
+            missing = [msg_id for msg_id in missing if msg_id not in found]
+
+        if missing:
+            service = self._get_service()
+            fetched: dict[str, dict] = {}
+
+            def on_message(request_id: str, response: dict, exception: Exception | None) -> None:
+                if exception is None:  # API error - message not found or permission denied
+                    self._metadata_cache.put(request_id, response)
+                    fetched[request_id] = response
+
+            for start in range(0, len(missing), _METADATA_BATCH_SIZE):
+                batch = service.new_batch_http_request(callback=on_message)
+                for msg_id in missing[start : start + _METADATA_BATCH_SIZE]:
+                    batch.add(
+                        service.users()
+                        .messages()
+                        .get(
+                            userId="me",
+                            id=msg_id,
+                            format="metadata",
+                            metadataHeaders=["From", "To", "Subject", "Date"],
+                        ),
+                        request_id=msg_id,
+                    )
+                try:
+                    batch.execute()
+                except Exception as e:
+                    _logger.warning("Gmail metadata batch failed: %s", e)
+
+            self._store.put_many("meta", fetched)
+            found.update(fetched)
+
+        return [found[msg_id] for msg_id in msg_ids if msg_id in found]
+
+    def _fetch_message_full(self, msg_id: str) -> dict | None:
+        cached = self._full_cache.get(msg_id)
+        if cached is None:
+            cached = self._store.get_many("full", [msg_id]).get(msg_id)
+            if cached is not None:
+                self._full_cache.put(msg_id, cached)
+        if cached is not None:
+            return cached
 
         try:
             service = self._get_service()
             msg = (
                 service.users()
                 .messages()
-                .get(
-                    userId="me",
-                    id=msg_id,
-                    format="metadata",
-                    metadataHeaders=["From", "To", "Subject", "Date"],
-                )
+                .get(userId="me", id=msg_id, format="full", fields=_FULL_MESSAGE_FIELDS)
                 .execute()
             )
-            self._emails_cache[cache_key] = msg
-            return msg
-        except Exception:
-            return None  # API error - message not found or permission denied
-
-    def _fetch_message_full(self, msg_id: str) -> dict | None:
-        cache_key = f"full:{msg_id}"
-        if cache_key in self._emails_cache:
-            return self._emails_cache[cache_key]
-
-        try:
-            service = self._get_service()
-            msg = service.users().messages().get(userId="me", id=msg_id, format="full").execute()
-            self._emails_cache[cache_key] = msg
+            self._full_cache.put(msg_id, msg)
+            self._store.put_many("full", {msg_id: msg})
             return msg
         except Exception:
             return None  # API error fetching full message
@@ -371,7 +719,7 @@ class GmailSource:
         header_dict = extract_headers(headers)
 
         internal_date = int(raw.get("internalDate", 0))
-        email_date = parse_email_date(headers, internal_date)
+        email_date = parse_email_date(header_dict.get("date"), internal_date)
 
         subject = decode_email_header(header_dict.get("subject", ""))
         sender = decode_email_header(header_dict.get("from", ""))
@@ -399,8 +747,8 @@ class GmailSource:
 
     def _parse_full_message(self, raw: dict) -> RawItem:
         payload = raw.get("payload", {})
-        plain_text, html_text = find_email_parts(payload)
-        content = plain_text.strip() if plain_text.strip() else html_to_plain(html_text)
+        plain_text, html_text = find_email_parts(payload, html_fallback_only=True)
+        content = plain_text.strip() or html_to_plain(html_text)
         if not content:
             content = raw.get("snippet", "")
         return self._build_raw_item(raw, content)
@@ -450,13 +798,8 @@ class GmailSource:
             .execute()
         )
 
-        items = []
-        for msg_meta in result.get("messages", []):
-            msg = self._fetch_message_metadata(msg_meta["id"])
-            if msg:
-                items.append(self._parse_metadata(msg))
-
-        return items
+        msg_ids = [msg_meta["id"] for msg_meta in result.get("messages", [])]
+        return [self._parse_metadata(msg) for msg in self._fetch_messages_metadata(msg_ids)]
 
     def list_recent(self, days: int = 7, limit: int = 50) -> list[SourceItem]:
         """Get recent emails."""
@@ -475,19 +818,18 @@ class GmailSource:
         )
 
         items = []
-        for msg_meta in result.get("messages", []):
-            msg = self._fetch_message_metadata(msg_meta["id"])
-            if msg:
-                raw_item = self._parse_metadata(msg)
-                items.append(
-                    SourceItem(
-                        identity=raw_item.source_id,
-                        title=raw_item.title,
-                        source=self.name,
-                        timestamp=raw_item.created_at,
-                        preview=raw_item.metadata.get("snippet"),
-                    )
+        msg_ids = [msg_meta["id"] for msg_meta in result.get("messages", [])]
+        for msg in self._fetch_messages_metadata(msg_ids):
+            raw_item = self._parse_metadata(msg)
+            items.append(
+                SourceItem(
+                    identity=raw_item.source_id,
+                    title=raw_item.title,
+                    source=self.name,
+                    timestamp=raw_item.created_at,
+                    preview=raw_item.metadata.get("snippet"),
                 )
+            )
 
         return items
 
@@ -513,6 +855,7 @@ class MultiGmailSource:
                 self._errors[token_path.name] = str(e)
 
         self._days = days_back
+        self._accounts = AccountIndex(self.sources)
 
     @property
     def errors(self) -> dict[str, str]:
@@ -523,22 +866,15 @@ class MultiGmailSource:
         return {"accounts": self.list_accounts(), "days": self._days}
 
     def list_accounts(self) -> list[str]:
-        accounts: list[str] = []
-        for src in self.sources:
-            email = src.get_email_address()
-            if email:
-                accounts.append(email)
-        return accounts
+        return self._accounts.list_accounts()
 
     def send_email(self, account: str, to: str, subject: str, body: str, html: bool = False) -> str:
         if not account:
             return "Error: account is required"
 
-        account_lower = account.lower().strip()
-        for src in self.sources:
-            email = src.get_email_address().lower()
-            if email == account_lower:
-                return src.send(to=to, subject=subject, body=body, from_email=account, html=html)
+        src = self._accounts.by_email().get(account.lower().strip())
+        if src is not None:
+            return src.send(to=to, subject=subject, body=body, from_email=account, html=html)
 
         accounts = self.list_accounts()
         if accounts:
@@ -557,24 +893,26 @@ class MultiGmailSource:
         _logger.warning("Gmail failed for %s: %s", key, e)
         self._errors[key] = str(e)
 
-    def search(self, query: str, limit: int = 50) -> list[RawItem]:
-        items: list[RawItem] = []
-        per_account = max(limit // len(self.sources), 10) if self.sources else limit
-        for src in self.sources:
+    def _collect[T](self, fn: Callable[[GmailSource], list[T]]) -> list[T]:
+        def fetch(src: GmailSource) -> list[T]:
             try:
-                items.extend(src.search(query, limit=per_account))
+                return fn(src)
             except Exception as e:
                 self._handle_source_error(src, e)
-        items.sort(key=lambda x: x.updated_at, reverse=True)
-        return items[:limit]
+                return []
+
+        batches = map_accounts(fetch, self.sources)
+        return [item for batch in batches for item in batch]
+
+    def search(self, query: str, limit: int = 50) -> list[RawItem]:
+        per_account = max(limit // len(self.sources), 10) if self.sources else limit
+        items = self._collect(lambda src: src.search(query, limit=per_account))
+        # Accounts come back in Gmail's internalDate order, not by header date,
+        # so they can't be merged; a bounded heap still avoids the full sort.
+        return heapq.nlargest(limit, items, key=lambda x: x.updated_at)
 
     def list_recent(self, days: int = 7, limit: int = 50) -> list[SourceItem]:
-        items: list[SourceItem] = []
         per_account = max(limit // len(self.sources), 5) if self.sources else limit
-        for src in self.sources:
-            try:
-                items.extend(src.list_recent(days=days, limit=per_account))
-            except Exception as e:
-                self._handle_source_error(src, e)
-        items.sort(key=lambda x: x.timestamp or datetime.min.replace(tzinfo=UTC), reverse=True)
-        return items[:limit]
+        items = self._collect(lambda src: src.list_recent(days=days, limit=per_account))
+        oldest = datetime.min.replace(tzinfo=UTC)
+        return heapq.nlargest(limit, items, key=lambda x: x.timestamp or oldest)
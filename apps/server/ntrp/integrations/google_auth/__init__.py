@@ -1,3 +1,4 @@
+from ntrp.integrations.google_auth.accounts import AccountIndex, map_accounts
 from ntrp.integrations.google_auth.auth import (
     add_gmail_account,
     discover_calendar_tokens,
@@ -8,10 +9,12 @@ from ntrp.integrations.google_auth.auth import (
 )
 
 __all__ = [
+    "AccountIndex",
     "add_gmail_account",
     "discover_calendar_tokens",
     "discover_gmail_tokens",
     "get_google_credentials",
     "gmail_token_path",
     "has_scope",
+    "map_accounts",
 ]
@@ -0,0 +1,57 @@
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Protocol
+
+# Shared by every multi-account Google source (Gmail, Calendar): integration
+# syncs rebuild the sources, and a per-instance pool would leave its idle
+# threads behind on each rebuild.
+_ACCOUNT_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="google-accounts")
+
+
+class GoogleAccount(Protocol):
+    _email_address: str | None
+
+    def get_email_address(self) -> str: ...
+
+
+def map_accounts[S, T](fn: Callable[[S], T], sources: list[S]) -> list[T]:
+    """Run `fn` for every account, in source order.
+
+    Each account is an independent blocking HTTPS round-trip (with its own
+    connection), so they fan out: wall time is the slowest account, not the sum.
+    """
+    if len(sources) > 1:
+        return list(_ACCOUNT_POOL.map(fn, sources))
+    return [fn(src) for src in sources]
+
+
+class AccountIndex[S: GoogleAccount]:
+    """Account email lookups for a multi-account source's `sources`."""
+
+    def __init__(self, sources: list[S]):
+        self._sources = sources
+        self._by_email: dict[str, S] | None = None
+        self._all_resolved = False
+
+    def list_accounts(self) -> list[str]:
+        # First lookup per account is a blocking profile RPC; resolve them
+        # together. Later calls hit each source's memoized address.
+        if any(src._email_address is None for src in self._sources):
+            emails = map_accounts(lambda src: src.get_email_address(), self._sources)
+        else:
+            emails = [src.get_email_address() for src in self._sources]
+        return [email for email in emails if email]
+
+    def by_email(self) -> dict[str, S]:
+        # Rebuilt only while some account's address is still unresolved (e.g. a
+        # transient lookup failure); otherwise dispatch is a single dict hit.
+        # Resolution is tracked per source, not by map size: two token files
+        # for the same address share one map entry.
+        if self._by_email is None or not self._all_resolved:
+            by_email: dict[str, S] = {}
+            for src in self._sources:
+                if email := src.get_email_address():
+                    by_email.setdefault(email.lower(), src)
+            self._by_email = by_email
+            self._all_resolved = all(src._email_address is not None for src in self._sources)
+        return self._by_email
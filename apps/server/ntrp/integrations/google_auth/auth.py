@@ -1,4 +1,5 @@
 import json
+import os
 from pathlib import Path
 from typing import Literal
 
@@ -107,21 +108,39 @@ def google_credentials_status() -> dict:
     return status
 
 
+_token_files_cache: dict[tuple[str, ...], tuple[tuple[Path, int], list[Path]]] = {}
+
+
+def _token_files(*prefixes: str) -> list[Path]:
+    # One scandir pass with plain string checks instead of a Path.glob (and its
+    # fnmatch machinery) per pattern, reused until the directory's mtime moves
+    # (any token added, renamed or removed).
+    try:
+        stamp = (NTRP_DIR, NTRP_DIR.stat().st_mtime_ns)
+        cached = _token_files_cache.get(prefixes)
+        if cached is not None and cached[0] == stamp:
+            return list(cached[1])
+        with os.scandir(NTRP_DIR) as it:
+            files = [
+                Path(entry.path)
+                for entry in it
+                if entry.name.startswith(prefixes) and entry.name.endswith(".json") and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
+    _token_files_cache[prefixes] = (stamp, files)
+    return list(files)
+
+
 def discover_gmail_tokens() -> list[Path]:
     """Find all Gmail token files in ~/.ntrp/"""
-    if not NTRP_DIR.exists():
-        return []
-    return sorted(list(NTRP_DIR.glob("gmail_token*.json")))
+    return sorted(_token_files("gmail_token"))
 
 
 def discover_calendar_tokens() -> list[Path]:
     """Find all token files that have calendar scope (Gmail tokens work too)."""
-    if not NTRP_DIR.exists():
-        return []
-    # Check both calendar_token*.json AND gmail_token*.json (unified auth)
-    calendar_tokens = list(NTRP_DIR.glob("calendar_token*.json"))
-    gmail_tokens = list(NTRP_DIR.glob("gmail_token*.json"))
-    return sorted(calendar_tokens + gmail_tokens)
+    # Both calendar_token*.json AND gmail_token*.json (unified auth)
+    return sorted(_token_files("calendar_token", "gmail_token"))
 
 
 def gmail_token_path(email: str) -> Path:
@@ -140,6 +159,30 @@ def _next_calendar_token_path() -> Path:
     raise RuntimeError("Could not allocate a calendar token filename")
 
 
+# token path -> (st_mtime_ns, Credentials). A rewrite of the token file (ours
+# after a refresh, or another process re-adding the account) changes the mtime
+# and forces a reload.
+_credentials_cache: dict[str, tuple[int, Credentials]] = {}
+
+
+def _load_cached_credentials(token_path: Path) -> Credentials | None:
+    try:
+        mtime_ns = token_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    key = str(token_path)
+    cached = _credentials_cache.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    creds = Credentials.from_authorized_user_info(json.loads(token_path.read_bytes()))
+    _credentials_cache[key] = (mtime_ns, creds)
+    return creds
+
+
+def _remember_credentials(token_path: Path, creds: Credentials) -> None:
+    _credentials_cache[str(token_path)] = (token_path.stat().st_mtime_ns, creds)
+
+
 def get_google_credentials(
     token_path: Path,
     scopes: list[str] | None = None,
@@ -161,10 +204,7 @@ def get_google_credentials(
         PermissionError: If token lacks required scopes
     """
     scopes = scopes or SCOPES_ALL
-    creds = None
-
-    if token_path.exists():
-        creds = Credentials.from_authorized_user_file(str(token_path))
+    creds = _load_cached_credentials(token_path)
 
     if not creds or not creds.valid:
         refreshed = False
@@ -187,6 +227,7 @@ def get_google_credentials(
 
         token_path.parent.mkdir(parents=True, exist_ok=True)
         token_path.write_text(creds.to_json())
+        _remember_credentials(token_path, creds)
 
     if require_scopes and creds.scopes:
         for scope in require_scopes:
@@ -15,6 +15,7 @@ class IntegrationRegistry:
         self._integrations: dict[str, Integration] = {i.id: i for i in integrations}
         self._clients: dict[str, object] = {}
         self._errors: dict[str, str] = {}
+        self._connected: frozenset[str] = frozenset()
 
     def sync(self, config: Config) -> None:
         for id, integration in self._integrations.items():
@@ -32,6 +33,7 @@ class IntegrationRegistry:
                 self._clients.pop(id, None)
             else:
                 self._clients[id] = client
+        self._connected = frozenset(self._clients)
 
     @property
     def integrations(self) -> dict[str, Integration]:
@@ -41,6 +43,11 @@ class IntegrationRegistry:
     def clients(self) -> dict[str, object]:
         return dict(self._clients)
 
+    @property
+    def connected(self) -> frozenset[str]:
+        """Ids with a built client; refreshed on sync, so reads don't copy `clients`."""
+        return self._connected
+
     @property
     def errors(self) -> dict[str, str]:
         return dict(self._errors)
@@ -1,7 +1,16 @@
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+
 from exa_py import Exa
 
 from ntrp.integrations.web.types import WebContentResult, WebSearchResult
 
+# Exa fetches a get_contents batch serially; large URL lists are split into
+# chunks that run on parallel requests.
+CONTENTS_CHUNK_SIZE = 10
+CONTENTS_MAX_CONCURRENCY = 8
+
 
 class ExaWebSource:
     name = "web"
@@ -24,6 +33,14 @@ class ExaWebSource:
         num_results: int = 5,
         category: str | None = None,
     ) -> list[WebSearchResult]:
+        return list(self._iter_search(query, num_results, category))
+
+    def _iter_search(
+        self,
+        query: str,
+        num_results: int = 5,
+        category: str | None = None,
+    ) -> Iterator[WebSearchResult]:
         client = self._get_client()
 
         search_params = {
@@ -40,28 +57,36 @@ class ExaWebSource:
             summary={"query": f"Key information about: {query}"},
         )
 
-        return [
-            WebSearchResult(
+        for r in result.results:
+            yield WebSearchResult(
                 title=r.title or "",
                 url=r.url or "",
                 published_date=getattr(r, "published_date", None),
                 summary=getattr(r, "summary", None),
                 highlights=getattr(r, "highlights", None),
             )
-            for r in result.results
-        ]
 
     def get_contents(self, urls: list[str]) -> list[WebContentResult]:
+        return list(self._iter_contents(urls))
+
+    def _iter_contents(self, urls: list[str]) -> Iterator[WebContentResult]:
+        """Convert Exa results chunk by chunk. All chunks are fetched (in
+        parallel) before the first result is yielded."""
         client = self._get_client()
-        result = client.get_contents(urls, text=True)
+        if len(urls) <= CONTENTS_CHUNK_SIZE:
+            batches = [client.get_contents(urls, text=True).results]
+        else:
+            chunks = [urls[i : i + CONTENTS_CHUNK_SIZE] for i in range(0, len(urls), CONTENTS_CHUNK_SIZE)]
+            with ThreadPoolExecutor(max_workers=min(len(chunks), CONTENTS_MAX_CONCURRENCY)) as pool:
+                batches = [
+                    result.results for result in pool.map(lambda chunk: client.get_contents(chunk, text=True), chunks)
+                ]
 
-        return [
-            WebContentResult(
+        for r in chain.from_iterable(batches):
+            yield WebContentResult(
                 title=getattr(r, "title", None),
                 url=r.url or "",
                 text=getattr(r, "text", None),
                 published_date=getattr(r, "published_date", None),
                 author=getattr(r, "author", None),
             )
-            for r in result.results
-        ]
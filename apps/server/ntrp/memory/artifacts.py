@@ -885,23 +885,27 @@ class ArtifactMemoryStore:
         if stat.S_ISLNK(st.st_mode) or not stat.S_ISDIR(st.st_mode):
             return []
         out: list[Path] = []
+        # scandir's d_type answers the type checks without a per-child lstat
         try:
-            children = sorted(directory.iterdir(), key=lambda p: p.name)
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
         except OSError:
             return []
-        for child in children:
+        for entry in entries:
             try:
-                child_st = child.lstat()
-            except FileNotFoundError:
+                if entry.is_symlink():
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    out.extend(self._walk_markdown_files(directory / entry.name))
+                    continue
+                if not (entry.name.endswith(".md") and entry.is_file(follow_symlinks=False)):
+                    continue
+            except OSError:
                 continue
-            if stat.S_ISLNK(child_st.st_mode):
-                continue
-            if stat.S_ISDIR(child_st.st_mode):
-                out.extend(self._walk_markdown_files(child))
-            elif stat.S_ISREG(child_st.st_mode) and child.suffix == ".md":
-                rel = child.relative_to(self.root).as_posix()
-                if self._allowed_artifact_rel(rel):
-                    out.append(child)
+            child = directory / entry.name
+            rel = child.relative_to(self.root).as_posix()
+            if self._allowed_artifact_rel(rel):
+                out.append(child)
         return out
 
     def _unlink_regular_artifact(self, rel: str) -> None:
@@ -3,7 +3,7 @@ import asyncio
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
-from ntrp.integrations.gmail.client import GmailSource
+from ntrp.integrations.gmail.client import GmailSource, clear_message_cache
 from ntrp.integrations.google_auth.auth import (
     CREDENTIALS_PATH,
     GoogleServiceChoice,
@@ -102,6 +102,9 @@ async def gmail_remove(token_file: str, runtime: Runtime = Depends(get_runtime))
             pass
 
         token_path.unlink()
+        # The cache is keyed by token file name; a later account reusing the
+        # name must not inherit this one's mail.
+        await asyncio.to_thread(clear_message_cache, token_path)
         await runtime.sync_google_sources()
 
         return {"email": email, "status": "removed"}
@@ -39,13 +39,15 @@ def _config_response(rt: Runtime) -> dict:
         if model_id in known_models and effort in known_models[model_id].reasoning_efforts
     }
 
+    connected = rt.integrations.connected
+    errors = rt.integrations.errors
     integrations: dict[str, dict] = {}
     for integration in rt.integrations.integrations.values():
         if integration.id.startswith("_") or integration.build is None:
             continue  # core builtins / notifier-only
-        entry: dict = {"connected": integration.id in rt.integrations.clients}
-        if integration.id in rt.integrations.errors:
-            entry["error"] = rt.integrations.errors[integration.id]
+        entry: dict = {"connected": integration.id in connected}
+        if integration.id in errors:
+            entry["error"] = errors[integration.id]
         integrations[integration.id] = entry
 
     # Integration-specific extras the UI needs
@@ -65,14 +67,10 @@ def _config_response(rt: Runtime) -> dict:
     # Umbrella + memory (not direct integrations)
     integrations["google"] = {
         "enabled": config.google,
-        "connected": "gmail" in rt.integrations.clients or "calendar" in rt.integrations.clients,
+        "connected": "gmail" in connected or "calendar" in connected,
         **(
-            {
-                "error": "; ".join(
-                    e for e in (rt.integrations.errors.get("gmail"), rt.integrations.errors.get("calendar")) if e
-                )
-            }
-            if (rt.integrations.errors.get("gmail") or rt.integrations.errors.get("calendar"))
+            {"error": "; ".join(e for e in (errors.get("gmail"), errors.get("calendar")) if e)}
+            if (errors.get("gmail") or errors.get("calendar"))
             else {}
         ),
     }
@@ -274,6 +272,10 @@ async def update_embedding_model(
     cfg_svc: ConfigService = Depends(require_config_service),
 ):
     old_model = runtime.config.embedding_model
+    if req.embedding_model == old_model:
+        # Re-selecting the active model: skip the settings read/write and the
+        # runtime reload entirely.
+        return {"status": "unchanged", "embedding_model": old_model}
 
     try:
         await cfg_svc.update(embedding_model=req.embedding_model)
@@ -61,6 +61,6 @@ async def install_skill(request: InstallRequest, svc: SkillService = Depends(req
 
 @router.delete("/skills/{name}")
 async def remove_skill(name: str, svc: SkillService = Depends(require_skill_service)):
-    if not svc.remove(name):
+    if not await svc.remove(name):
         raise HTTPException(status_code=404, detail=f"Skill not found: {name}")
     return {"status": "removed", "name": name}
@@ -14,12 +14,19 @@ class ConfigService:
     def __init__(self, on_config_change: Callable[[], Awaitable[None]]):
         self._on_config_change = on_config_change
 
-    async def _with_rollback(self, mutate: Callable[[dict], None]) -> None:
+    async def _with_rollback(self, mutate: Callable[[dict], None], *, skip_unchanged: bool = False) -> None:
         settings = load_user_settings()
         backup = deepcopy(settings)
         mutate(settings)
-        save_user_settings(settings)
+        if skip_unchanged and settings == backup:
+            # Only for callers whose whole change lives in settings.json; custom
+            # models (models.json) and Codex tokens still need the reload.
+            return
+        # The write sits inside the rollback too: a save that fails halfway
+        # (settings.json already rotated to .bak) must not leave disk ahead of
+        # the running config.
         try:
+            save_user_settings(settings)
             await self._on_config_change()
         except Exception:
             save_user_settings(backup)
@@ -41,7 +48,9 @@ class ConfigService:
                 else:
                     settings[key] = value
 
-        await self._with_rollback(mutate)
+        # Idempotent submissions (e.g. re-saving the current chat model) leave
+        # nothing to persist or reload.
+        await self._with_rollback(mutate, skip_unchanged=True)
 
     async def connect_provider(self, provider: str, api_key: str) -> None:
         if provider not in PROVIDER_KEY_FIELDS:
@@ -79,7 +79,7 @@ class SessionService:
     ) -> SessionState:
         now = datetime.now(UTC)
         return SessionState(
-            session_id=session_id or f"{now.strftime('%Y%m%d_%H%M%S')}_{now.microsecond // 1000:03d}",
+            session_id=session_id or now.strftime("%Y%m%d_%H%M%S_%f")[:-3],
             started_at=now,
             name=name,
             session_type=session_type,
@@ -1,4 +1,11 @@
-from pathlib import Path
+import asyncio
+import shutil
+import tarfile
+import tempfile
+from collections.abc import Awaitable
+from pathlib import Path, PurePosixPath
+from typing import IO
+from urllib.parse import quote
 
 import httpx
 
@@ -7,8 +14,13 @@ from ntrp.logging import get_logger
 _logger = get_logger(__name__)
 
 GITHUB_API = "https://api.github.com"
+RAW_GITHUB = "https://raw.githubusercontent.com"
 MAX_DIR_DEPTH = 5
 MAX_FILE_SIZE = 512 * 1024  # 512 KB
+MAX_CONCURRENT_DOWNLOADS = 10
+MAX_TARBALL_SIZE = 50 * 1024 * 1024  # 50 MB
+_SPOOL_SIZE = 4 * 1024 * 1024
+_CHUNK_SIZE = 64 * 1024
 
 
 async def install_from_github(source: str, target_dir: Path) -> str:
@@ -26,64 +38,166 @@ async def install_from_github(source: str, target_dir: Path) -> str:
 
     try:
         async with httpx.AsyncClient(timeout=30) as client:
-            await _download_dir(client, owner, repo, path, skill_dir)
+            if not await _download_tarball(client, owner, repo, path, skill_dir):
+                await _download_tree(client, owner, repo, path, skill_dir)
     except httpx.HTTPStatusError as e:
-        _cleanup(skill_dir)
+        await asyncio.to_thread(_cleanup, skill_dir)
         if e.response.status_code == 404:
             raise ValueError(f"Not found: {source}") from None
         raise ValueError(f"GitHub API error: {e.response.status_code}") from None
     except Exception:
-        _cleanup(skill_dir)
+        await asyncio.to_thread(_cleanup, skill_dir)
         raise
 
+    if not skill_dir.exists():
+        raise ValueError(f"Not found: {source}")
     if not (skill_dir / "SKILL.md").exists():
-        _cleanup(skill_dir)
+        await asyncio.to_thread(_cleanup, skill_dir)
         raise ValueError(f"No SKILL.md found in {source}")
 
     _logger.info("Installed skill '%s' from %s", skill_name, source)
     return skill_name
 
 
-async def _download_dir(
-    client: httpx.AsyncClient,
-    owner: str,
-    repo: str,
-    path: str,
-    target: Path,
-    _depth: int = 0,
-) -> None:
-    if _depth > MAX_DIR_DEPTH:
-        raise ValueError(f"Skill directory too deeply nested (max {MAX_DIR_DEPTH} levels)")
-
-    url = f"{GITHUB_API}/repos/{owner}/{repo}/contents/{path}"
-    resp = await client.get(url, headers={"Accept": "application/vnd.github.v3+json"})
+async def _download_tarball(client: httpx.AsyncClient, owner: str, repo: str, path: str, target: Path) -> bool:
+    """Fetch the repo as one tarball and extract only `path` into `target`.
+
+    Returns False when the tarball can't be used (endpoint 404s or the repo is
+    larger than MAX_TARBALL_SIZE), so the caller falls back to the git tree
+    listing plus per-file downloads.
+    """
+    url = f"{GITHUB_API}/repos/{owner}/{repo}/tarball/HEAD"
+    with tempfile.SpooledTemporaryFile(max_size=_SPOOL_SIZE) as spool:
+        async with client.stream("GET", url, follow_redirects=True) as resp:
+            if resp.status_code == 404:
+                return False
+            resp.raise_for_status()
+            received = 0
+            async for chunk in resp.aiter_bytes(_CHUNK_SIZE):
+                received += len(chunk)
+                if received > MAX_TARBALL_SIZE:
+                    _logger.info("Tarball for %s/%s is too large, using contents API", owner, repo)
+                    return False
+                spool.write(chunk)
+        spool.seek(0)
+        await asyncio.to_thread(_extract_tarball, spool, PurePosixPath(path), target)
+    return True
+
+
+def _extract_tarball(fileobj: IO[bytes], subpath: PurePosixPath, target: Path) -> None:
+    with tarfile.open(fileobj=fileobj, mode="r:gz") as tar:
+        _extract_subtree(tar, subpath, target)
+
+
+def _extract_subtree(tar: tarfile.TarFile, subpath: PurePosixPath, target: Path) -> None:
+    # GitHub wraps the tree in a single "<owner>-<repo>-<sha>/" directory.
+    root = target.resolve()
+    for member in tar:
+        if not member.isfile():
+            continue
+        parts = PurePosixPath(member.name).parts[1:]
+        if len(parts) <= len(subpath.parts) or PurePosixPath(*parts[: len(subpath.parts)]) != subpath:
+            continue
+        relative = PurePosixPath(*parts[len(subpath.parts) :])
+        if len(relative.parts) - 1 > MAX_DIR_DEPTH:
+            raise ValueError(f"Skill directory too deeply nested (max {MAX_DIR_DEPTH} levels)")
+        if ".." in relative.parts:
+            raise ValueError(f"Invalid filename in tarball: {relative}")
+        dest = (target / relative).resolve()
+        if not dest.is_relative_to(root):
+            raise ValueError(f"Path escapes skill directory: {relative}")
+        if member.size > MAX_FILE_SIZE:
+            _logger.warning("Skipping oversized file %s (%d bytes)", relative, member.size)
+            continue
+        source = tar.extractfile(member)
+        if source is None:
+            continue
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.write_bytes(source.read())
+
+
+async def _download_tree(client: httpx.AsyncClient, owner: str, repo: str, path: str, target: Path) -> None:
+    """List the whole repo with one recursive git-trees call, then fetch every
+    blob under `path` from raw.githubusercontent.com in parallel."""
+    headers = {"Accept": "application/vnd.github.v3+json"}
+    resp = await client.get(f"{GITHUB_API}/repos/{owner}/{repo}", headers=headers)
     resp.raise_for_status()
-    items = resp.json()
-
-    target.mkdir(parents=True, exist_ok=True)
-
-    for item in items:
-        name = item["name"]
-        if "/" in name or name in (".", ".."):
-            raise ValueError(f"Invalid filename from GitHub API: {name}")
-
-        dest = (target / name).resolve()
-        if not dest.is_relative_to(target.resolve()):
-            raise ValueError(f"Path escapes skill directory: {name}")
+    branch = resp.json()["default_branch"]
 
-        if item["type"] == "file":
-            size = item.get("size", 0)
-            if size > MAX_FILE_SIZE:
-                _logger.warning("Skipping oversized file %s (%d bytes)", name, size)
-                continue
-            file_resp = await client.get(item["download_url"])
-            file_resp.raise_for_status()
-            dest.write_bytes(file_resp.content)
-        elif item["type"] == "dir":
-            await _download_dir(client, owner, repo, f"{path}/{name}", target / name, _depth + 1)
+    resp = await client.get(
+        f"{GITHUB_API}/repos/{owner}/{repo}/git/trees/{quote(branch, safe='')}",
+        params={"recursive": "1"},
+        headers=headers,
+    )
+    resp.raise_for_status()
+    listing = resp.json()
+    if listing.get("truncated"):
+        raise ValueError(f"Repository {owner}/{repo} is too large to list")
+
+    prefix = PurePosixPath(path)
+    root = target.resolve()
+    files: list[tuple[str, Path]] = []
+    for entry in listing["tree"]:
+        if entry["type"] != "blob":
+            continue
+        entry_path = PurePosixPath(entry["path"])
+        if not entry_path.is_relative_to(prefix) or entry_path == prefix:
+            continue
+        relative = entry_path.relative_to(prefix)
+        if len(relative.parts) - 1 > MAX_DIR_DEPTH:
+            raise ValueError(f"Skill directory too deeply nested (max {MAX_DIR_DEPTH} levels)")
+        if ".." in relative.parts:
+            raise ValueError(f"Invalid filename from GitHub API: {relative}")
+        dest = (target / relative).resolve()
+        if not dest.is_relative_to(root):
+            raise ValueError(f"Path escapes skill directory: {relative}")
+        size = entry.get("size", 0)
+        if size > MAX_FILE_SIZE:
+            _logger.warning("Skipping oversized file %s (%d bytes)", relative, size)
+            continue
+        files.append((f"{RAW_GITHUB}/{owner}/{repo}/{branch}/{quote(entry['path'])}", dest))
+
+    if not files:
+        return
+    if not any(dest == root / "SKILL.md" for _, dest in files):
+        raise ValueError(f"No SKILL.md found in {owner}/{repo}/{path}")
+
+    for _, dest in files:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+    await _gather_or_cancel([_download_file(client, semaphore, url, dest) for url, dest in files])
+
+
+async def _download_file(client: httpx.AsyncClient, semaphore: asyncio.Semaphore, url: str, dest: Path) -> None:
+    # Buffer the body, then write it out with a single thread hop rather than
+    # one per chunk; files are capped at MAX_FILE_SIZE, so the spool stays in memory.
+    with tempfile.SpooledTemporaryFile(max_size=_SPOOL_SIZE) as spool:
+        async with semaphore, client.stream("GET", url) as resp:
+            resp.raise_for_status()
+            async for chunk in resp.aiter_bytes(_CHUNK_SIZE):
+                spool.write(chunk)
+        spool.seek(0)
+        await asyncio.to_thread(_write_file, spool, dest)
+
+
+def _write_file(fileobj: IO[bytes], dest: Path) -> None:
+    with dest.open("wb") as f:
+        shutil.copyfileobj(fileobj, f)
+
+
+async def _gather_or_cancel(jobs: list[Awaitable[None]]) -> None:
+    # Plain gather leaves siblings running after the first failure, which would
+    # race the caller's cleanup of the skill dir. Cancel them and re-raise the
+    # original error unchanged so callers can still match on its type.
+    tasks = [asyncio.ensure_future(job) for job in jobs]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
 
 
 def _cleanup(path: Path) -> None:
-    import shutil
-
     shutil.rmtree(path, ignore_errors=True)
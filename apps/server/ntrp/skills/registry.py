@@ -1,6 +1,8 @@
+import os
 import re
 import shutil
-from dataclasses import dataclass
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
 
@@ -8,9 +10,13 @@ import yaml
 
 from ntrp.logging import get_logger
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 _logger = get_logger(__name__)
 
-_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n?", re.DOTALL)
 _SKILL_NAME_RE = re.compile(r"^[a-z][a-z0-9-]{0,47}$")
 
 
@@ -27,6 +33,10 @@ class SkillMeta:
     # "workflow" = a runnable Orchestra preset; its dir holds a workflow.py the
     # `workflow` tool executes verbatim. Same registry, two flavors.
     kind: str = "skill"
+    # Parsed SKILL.md body and the mtime it was read at; lets load_body skip
+    # the disk + YAML round-trip and reload() reuse untouched skills.
+    body: str = field(default="", repr=False)
+    mtime: float = field(default=0.0, repr=False)
 
 
 @dataclass
@@ -37,30 +47,99 @@ class SkillValidationIssue:
     detail: str
 
 
+def _split_frontmatter(content: str) -> tuple[str, str] | None:
+    # Opening "---" line, then YAML up to the first line starting with "---".
+    if not content.startswith("---"):
+        return None
+    start = content.find("\n", 3)
+    if start == -1 or (start > 3 and not content[3:start].isspace()):
+        return None
+    end = content.find("\n---", start + 1)
+    if end == -1:
+        return None
+    return content[start + 1 : end], content[end + 4 :].lstrip()
+
+
 def _parse_skill_md(content: str) -> tuple[dict, str] | None:
-    m = _FRONTMATTER_RE.match(content)
-    if not m:
+    split = _split_frontmatter(content)
+    if split is None:
         return None
+    raw, body = split
     try:
-        frontmatter = yaml.safe_load(m.group(1))
+        frontmatter = yaml.load(raw, Loader=_YamlLoader)
     except yaml.YAMLError:
         return None
     if not isinstance(frontmatter, dict):
         return None
-    return frontmatter, content[m.end() :]
+    return frontmatter, body
+
+
+@dataclass(frozen=True)
+class _SkillsState:
+    """Immutable registry contents plus the views derived from them.
+
+    The registry swaps a whole new state in with one attribute assignment, so
+    readers on any task or thread see either the old or the new skill set,
+    never a half-applied reload.
+    """
+
+    version: int
+    by_name: dict[str, SkillMeta]
+    metas: tuple[SkillMeta, ...]
+    names: tuple[str, ...]
+    names_csv: str
+    prompt_xml: str
+    validation_issues: tuple[SkillValidationIssue, ...]
+
+    @classmethod
+    def build(
+        cls, version: int, by_name: dict[str, SkillMeta], validation_issues: tuple[SkillValidationIssue, ...]
+    ) -> "_SkillsState":
+        names = tuple(by_name)
+        return cls(
+            version=version,
+            by_name=by_name,
+            metas=tuple(by_name.values()),
+            names=names,
+            names_csv=", ".join(names),
+            prompt_xml=_build_prompt_xml(by_name.values()),
+            validation_issues=validation_issues,
+        )
+
+
+def _build_prompt_xml(metas: Iterable[SkillMeta]) -> str:
+    skills = "\n".join(
+        "  <skill>\n"
+        f"    <name>{meta.name}</name>\n"
+        f"    <description>{meta.description}</description>\n"
+        f"    <location>{meta.location}</location>\n"
+        "  </skill>"
+        for meta in metas
+    )
+    return f"<available_skills>\n{skills}\n</available_skills>" if skills else ""
 
 
 class SkillRegistry:
     def __init__(self):
-        self._skills: dict[str, SkillMeta] = {}
-        self._validation_issues: list[SkillValidationIssue] = []
+        self._state = _SkillsState.build(0, {}, ())
+
+    @property
+    def version(self) -> int:
+        """Bumped on every load/reload/remove; lets callers cache derived data."""
+        return self._state.version
 
     def load(self, dirs: list[tuple[Path, str]]) -> None:
-        self._validation_issues.clear()
+        self._publish(dict(self._state.by_name), dirs, {})
+
+    def _publish(
+        self, skills: dict[str, SkillMeta], dirs: list[tuple[Path, str]], previous: dict[Path, SkillMeta]
+    ) -> None:
+        issues: list[SkillValidationIssue] = []
         for path, location in dirs:
-            self._scan_dir(path, location)
-        if self._skills:
-            _logger.info("Loaded %d skill(s): %s", len(self._skills), ", ".join(self._skills))
+            self._scan_dir(path, location, previous, skills, issues)
+        self._state = _SkillsState.build(self._state.version + 1, skills, tuple(issues))
+        if skills:
+            _logger.info("Loaded %d skill(s): %s", len(skills), ", ".join(skills))
 
     @property
     def validation_issues(self) -> list[dict[str, str]]:
@@ -71,22 +150,38 @@ class SkillRegistry:
                 "reason": issue.reason,
                 "detail": issue.detail,
             }
-            for issue in self._validation_issues
+            for issue in self._state.validation_issues
         ]
 
-    def _record_issue(self, path: Path, location: str, reason: str, detail: str) -> None:
-        self._validation_issues.append(
-            SkillValidationIssue(path=path, location=location, reason=reason, detail=detail)
-        )
-
-    def _scan_dir(self, base: Path, location: str) -> None:
-        if not base.exists():
+    def _scan_dir(
+        self,
+        base: Path,
+        location: str,
+        previous: dict[Path, SkillMeta],
+        skills: dict[str, SkillMeta],
+        issues: list[SkillValidationIssue],
+    ) -> None:
+        # scandir's DirEntry carries d_type, so filtering directories costs no
+        # extra stat; the SKILL.md stat doubles as the existence check.
+        try:
+            with os.scandir(base) as it:
+                entries = sorted((entry for entry in it if entry.is_dir()), key=lambda entry: entry.name)
+        except FileNotFoundError:
             return
-        for skill_dir in sorted(base.iterdir()):
-            if not skill_dir.is_dir():
-                continue
+        for entry in entries:
+            skill_dir = Path(entry.path)
             skill_md = skill_dir / "SKILL.md"
-            if not skill_md.exists():
+            try:
+                mtime = os.stat(skill_md).st_mtime
+            except FileNotFoundError:
+                continue
+            except OSError:
+                _logger.warning("Failed to stat %s", skill_md)
+                continue
+            cached = previous.get(skill_dir)
+            if cached is not None and cached.mtime == mtime and cached.location == location:
+                if cached.name not in skills:
+                    skills[cached.name] = cached
                 continue
             try:
                 content = skill_md.read_text()
@@ -97,11 +192,12 @@ class SkillRegistry:
             if not parsed:
                 _logger.warning("Invalid frontmatter in %s", skill_md)
                 continue
-            frontmatter, _ = parsed
+            frontmatter, body = parsed
             name = frontmatter.get("name")
             description = frontmatter.get("description")
             if not isinstance(name, str) or not _SKILL_NAME_RE.fullmatch(name):
-                self._record_issue(
+                _record_issue(
+                    issues,
                     skill_md,
                     location,
                     "invalid_name",
@@ -109,7 +205,8 @@ class SkillRegistry:
                 )
                 continue
             if skill_dir.name != name:
-                self._record_issue(
+                _record_issue(
+                    issues,
                     skill_md,
                     location,
                     "directory_name_mismatch",
@@ -117,21 +214,22 @@ class SkillRegistry:
                 )
                 continue
             if not isinstance(description, str) or not description.strip():
-                self._record_issue(skill_md, location, "missing_description", "Skill description is required.")
+                _record_issue(issues, skill_md, location, "missing_description", "Skill description is required.")
                 _logger.warning("Missing name or description in %s", skill_md)
                 continue
-            if name in self._skills:
+            if name in skills:
                 continue
             reviewed_at = _optional_date(frontmatter.get("reviewed_at"))
             if frontmatter.get("reviewed_at") is not None and reviewed_at is None:
-                self._record_issue(
+                _record_issue(
+                    issues,
                     skill_md,
                     location,
                     "invalid_reviewed_at",
                     "reviewed_at must be an ISO date.",
                 )
                 continue
-            self._skills[name] = SkillMeta(
+            skills[name] = SkillMeta(
                 name=name,
                 description=description.strip(),
                 path=skill_dir,
@@ -140,33 +238,25 @@ class SkillRegistry:
                 version=_optional_string(frontmatter.get("version")),
                 reviewed_at=reviewed_at,
                 kind="workflow" if frontmatter.get("kind") == "workflow" else "skill",
+                body=body.strip(),
+                mtime=mtime,
             )
 
-    def list_all(self) -> list[SkillMeta]:
-        return list(self._skills.values())
+    def list_all(self) -> tuple[SkillMeta, ...]:
+        return self._state.metas
 
     def get(self, name: str) -> SkillMeta | None:
-        return self._skills.get(name)
+        return self._state.by_name.get(name)
 
     def load_body(self, name: str) -> str | None:
-        meta = self._skills.get(name)
-        if not meta:
-            return None
-        try:
-            content = (meta.path / "SKILL.md").read_text()
-        except OSError:
-            return None
-        parsed = _parse_skill_md(content)
-        if not parsed:
-            return None
-        _, body = parsed
-        return body.strip()
+        meta = self._state.by_name.get(name)
+        return meta.body if meta else None
 
     def load_workflow_script(self, name: str) -> str | None:
         """The Orchestra script for a workflow-kind preset (its workflow.py),
         loaded verbatim. None if the name isn't a workflow preset or has no
         script file."""
-        meta = self._skills.get(name)
+        meta = self._state.by_name.get(name)
         if not meta or meta.kind != "workflow":
             return None
         try:
@@ -176,53 +266,59 @@ class SkillRegistry:
 
     def render_skill_xml(self, name: str, args: str = "", *, args_label: str = "ARGUMENTS") -> str | None:
         meta = self.get(name)
-        body = self.load_body(name)
-        if meta is None or body is None:
+        if meta is None:
             return None
-        body = body.replace("<skill_path>", str(meta.path))
+        body = meta.body.replace("<skill_path>", str(meta.path))
         content = f'<skill name="{name}" path="{meta.path}">\n{body}\n</skill>'
         if args:
             content += f"\n\n{args_label}: {args}"
         return content
 
     def to_prompt_xml(self) -> str:
-        if not self._skills:
-            return ""
-        lines = ["<available_skills>"]
-        for meta in self._skills.values():
-            lines.append("  <skill>")
-            lines.append(f"    <name>{meta.name}</name>")
-            lines.append(f"    <description>{meta.description}</description>")
-            lines.append(f"    <location>{meta.location}</location>")
-            lines.append("  </skill>")
-        lines.append("</available_skills>")
-        return "\n".join(lines)
+        return self._state.prompt_xml
 
     def remove(self, name: str) -> bool:
-        meta = self._skills.get(name)
+        state = self._state
+        meta = state.by_name.get(name)
         if not meta:
             return False
         if meta.location == "builtin":
             _logger.warning("Cannot remove builtin skill '%s'", name)
             return False
         shutil.rmtree(meta.path, ignore_errors=True)
-        del self._skills[name]
+        return self.forget(name)
+
+    def forget(self, name: str) -> bool:
+        """Drop a skill from the published state without touching its files."""
+        state = self._state
+        if name not in state.by_name:
+            return False
+        skills = {key: value for key, value in state.by_name.items() if key != name}
+        self._state = _SkillsState.build(state.version + 1, skills, state.validation_issues)
         _logger.info("Removed skill '%s'", name)
         return True
 
     def reload(self, dirs: list[tuple[Path, str]]) -> None:
-        self._skills.clear()
-        self.load(dirs)
+        previous = {meta.path: meta for meta in self._state.metas}
+        self._publish({}, dirs, previous)
 
     @property
-    def names(self) -> list[str]:
-        return list(self._skills)
+    def names(self) -> tuple[str, ...]:
+        return self._state.names
+
+    @property
+    def names_csv(self) -> str:
+        return self._state.names_csv
 
     def __len__(self) -> int:
-        return len(self._skills)
+        return len(self._state.by_name)
 
     def __bool__(self) -> bool:
-        return bool(self._skills)
+        return bool(self._state.by_name)
+
+
+def _record_issue(issues: list[SkillValidationIssue], path: Path, location: str, reason: str, detail: str) -> None:
+    issues.append(SkillValidationIssue(path=path, location=location, reason=reason, detail=detail))
 
 
 def _optional_string(value: object) -> str | None:
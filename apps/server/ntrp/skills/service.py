@@ -1,4 +1,6 @@
+import asyncio
 import re
+import shutil
 from datetime import date
 from pathlib import Path
 
@@ -29,7 +31,7 @@ class SkillService:
     def __init__(self, registry: SkillRegistry):
         self._registry = registry
 
-    def list_all(self) -> list[SkillMeta]:
+    def list_all(self) -> tuple[SkillMeta, ...]:
         return self._registry.list_all()
 
     def get(self, name: str) -> SkillMeta | None:
@@ -146,5 +148,12 @@ class SkillService:
             name, description, body, source="workflow-preset", kind="workflow", workflow_script=script
         )
 
-    def remove(self, name: str) -> bool:
-        return self._registry.remove(name)
+    async def remove(self, name: str) -> bool:
+        meta = self._registry.get(name)
+        if meta is None or meta.location == "builtin":
+            return self._registry.remove(name)
+        # Only the rmtree goes to a thread (a large skill dir would stall the
+        # loop). The new state is published back here, on the loop thread, so
+        # it can't race reload()/install publishing theirs.
+        await asyncio.to_thread(shutil.rmtree, meta.path, ignore_errors=True)
+        return self._registry.forget(name)
@@ -26,7 +26,7 @@ async def use_skill(execution: ToolExecution, args: UseSkillInput) -> ToolResult
     meta = registry.get(args.skill)
     content = registry.render_skill_xml(args.skill, args.args)
     if meta is None or content is None:
-        available = ", ".join(registry.names)
+        available = registry.names_csv
         return ToolResult(
             content=f"Unknown skill: {args.skill}. Available: {available}",
             preview=f"Unknown skill: {args.skill}",
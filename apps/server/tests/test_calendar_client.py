@@ -0,0 +1,228 @@
+import threading
+import time
+from datetime import UTC, datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from ntrp.integrations.calendar.client import (
+    GoogleCalendar,
+    MultiCalendarSource,
+    format_event_time,
+    parse_event_datetime,
+)
+from ntrp.integrations.google_auth.accounts import AccountIndex
+from ntrp.search.types import RawItem
+
+
+def test_parse_event_datetime_handles_utc_suffix_and_offsets():
+    assert parse_event_datetime({"dateTime": "2026-05-16T09:30:00Z"}) == datetime(2026, 5, 16, 9, 30, tzinfo=UTC)
+    assert parse_event_datetime({"dateTime": "2026-05-16T09:30:00+02:00"}) == datetime(
+        2026, 5, 16, 9, 30, tzinfo=timezone(timedelta(hours=2))
+    )
+    assert parse_event_datetime({"dateTime": "not a date"}) is None
+    assert parse_event_datetime({}) is None
+
+
+def test_parse_event_datetime_treats_all_day_dates_as_utc_midnight():
+    assert parse_event_datetime({"date": "2026-05-16"}) == datetime(2026, 5, 16, tzinfo=UTC)
+    assert parse_event_datetime({"date": "16/05/2026"}) is None
+
+
+def test_format_event_time_renders_all_day_and_timed_ranges():
+    start = datetime(2026, 5, 16, tzinfo=UTC)
+    assert format_event_time(start, start + timedelta(days=1), True) == "2026-05-16 (all day)"
+    assert format_event_time(start, start + timedelta(days=3), True) == "2026-05-16 - 2026-05-19"
+
+    naive = datetime(2026, 5, 16, 9, 5)
+    assert format_event_time(naive, naive + timedelta(minutes=50), False) == "2026-05-16 09:05 - 09:55"
+    assert format_event_time(naive, None, False) == "2026-05-16 09:05"
+    assert format_event_time(None, None, False) == ""
+
+
+class _FakeCalendar:
+    def __init__(self, name: str, starts: list[str], barrier: threading.Barrier | None = None):
+        self.token_path = Path(f"{name}.json")
+        self.auth_error = None
+        self._starts = starts
+        self._barrier = barrier
+        self.email_lookups = 0
+        self.deletes: list[str] = []
+        self._email_address = None
+
+    def get_email_address(self) -> str:
+        self.email_lookups += 1
+        if self._email_address is None and self._barrier:
+            self._barrier.wait(timeout=5)
+        self._email_address = f"{self.token_path.stem}@example.com"
+        return self._email_address
+
+    def delete_event(self, event_id: str) -> str:
+        self.deletes.append(event_id)
+        if event_id in self._starts:
+            return f"Deleted event: {event_id}"
+        return f"Error deleting event: {event_id}"
+
+    def create_event(self, **kwargs) -> str:
+        return f"Created on {self.token_path.stem}: {kwargs['summary']}"
+
+    def get_upcoming(self, days: int, limit: int) -> list[RawItem]:
+        if self._barrier:
+            self._barrier.wait(timeout=5)
+        if not self._starts:
+            raise RuntimeError("boom")
+        return [
+            RawItem(
+                source="calendar",
+                source_id=s,
+                title=s,
+                content="",
+                created_at=parse_event_datetime({"dateTime": s}),
+                updated_at=parse_event_datetime({"dateTime": s}),
+                metadata={"start": s},
+            )
+            for s in self._starts
+        ]
+
+
+def _multi(*sources: _FakeCalendar) -> MultiCalendarSource:
+    multi = MultiCalendarSource.__new__(MultiCalendarSource)
+    multi.sources = list(sources)
+    multi._errors = {}
+    multi._accounts = AccountIndex(multi.sources)
+    multi._event_owner = {}
+    return multi
+
+
+def test_multi_calendar_fans_out_accounts_concurrently():
+    barrier = threading.Barrier(2)
+    multi = _multi(
+        _FakeCalendar("a", ["2026-05-16T10:00:00Z", "2026-05-18T10:00:00Z"], barrier),
+        _FakeCalendar("b", ["2026-05-17T10:00:00Z"], barrier),
+        _FakeCalendar("broken", []),
+    )
+
+    items = multi.get_upcoming(days=7, limit=10)
+
+    assert [i.metadata["start"] for i in items] == [
+        "2026-05-16T10:00:00Z",
+        "2026-05-17T10:00:00Z",
+        "2026-05-18T10:00:00Z",
+    ]
+
+
+def test_multi_calendar_orders_by_start_instant_across_offsets():
+    multi = _multi(
+        _FakeCalendar("a", ["2026-05-16T10:00:00+02:00", "2026-05-16T12:00:00+02:00"]),
+        _FakeCalendar("b", ["2026-05-16T09:00:00Z"]),
+    )
+
+    items = multi.get_upcoming(days=7, limit=2)
+
+    assert [i.metadata["start"] for i in items] == ["2026-05-16T10:00:00+02:00", "2026-05-16T09:00:00Z"]
+
+
+def test_multi_calendar_create_event_dispatches_by_email():
+    a, b = _FakeCalendar("a", []), _FakeCalendar("b", [])
+    multi = _multi(a, b)
+    start = datetime(2026, 5, 16, 9, tzinfo=UTC)
+
+    assert multi.create_event(account=" B@Example.com", summary="Sync", start=start) == "Created on b: Sync"
+    assert multi.create_event(account="a@example.com", summary="1:1", start=start) == "Created on a: 1:1"
+    assert multi.create_event(account="c@example.com", summary="x", start=start).startswith("Error: account not found")
+    assert (a.email_lookups, b.email_lookups) == (2, 2)
+
+
+def test_multi_calendar_list_accounts_resolves_addresses_concurrently():
+    barrier = threading.Barrier(2)
+    multi = _multi(_FakeCalendar("a", [], barrier), _FakeCalendar("b", [], barrier))
+
+    assert multi.list_accounts() == ["a@example.com", "b@example.com"]
+    assert multi.list_accounts() == ["a@example.com", "b@example.com"]
+
+
+def test_update_event_patches_only_changed_fields():
+    cal = GoogleCalendar(token_path=Path("token.json"))
+    cal._service = service = MagicMock()
+    events = service.events.return_value
+    events.patch.return_value.execute.return_value = {"summary": "Renamed", "htmlLink": "https://cal/e1"}
+
+    assert cal.update_event("e1", summary="Renamed") == "Updated event: Renamed\nhttps://cal/e1"
+    events.get.assert_not_called()
+    assert events.patch.call_args.kwargs["body"] == {"summary": "Renamed"}
+
+    start = datetime(2026, 5, 16, 9, tzinfo=UTC)
+    cal.update_event("e1", start=start, all_day=True)
+    events.get.assert_not_called()
+    assert events.patch.call_args.kwargs["body"] == {
+        "start": {"date": "2026-05-16", "dateTime": None},
+        "end": {"date": "2026-05-17", "dateTime": None},
+    }
+
+    events.get.return_value.execute.return_value = {"start": {"dateTime": "2026-05-10T10:00:00Z"}}
+    cal.update_event("e1", start=start)
+    assert events.get.call_args.kwargs["fields"] == "start"
+    assert events.patch.call_args.kwargs["body"] == {
+        "start": {"dateTime": start.isoformat(), "date": None},
+        "end": {"dateTime": (start + timedelta(hours=1)).isoformat(), "date": None},
+    }
+
+
+def test_multi_calendar_delete_goes_to_account_that_listed_the_event():
+    a = _FakeCalendar("a", ["2026-05-16T10:00:00"])
+    b = _FakeCalendar("b", ["2026-05-17T10:00:00"])
+    multi = _multi(a, b)
+    multi.get_upcoming()
+
+    assert multi.delete_event("2026-05-17T10:00:00") == "Deleted event: 2026-05-17T10:00:00"
+    assert (a.deletes, b.deletes) == ([], ["2026-05-17T10:00:00"])
+
+    assert multi.delete_event("unknown").startswith("Error: event not found")
+    assert (a.deletes[-1], b.deletes[-1]) == ("unknown", "unknown")
+
+
+def test_multi_calendar_shared_event_is_owned_by_first_account_in_order():
+    shared = "2026-05-16T10:00:00Z"
+
+    class _SlowCalendar(_FakeCalendar):
+        def get_upcoming(self, days: int, limit: int) -> list[RawItem]:
+            time.sleep(0.05)  # finish after "a" so completion order differs from source order
+            return super().get_upcoming(days, limit)
+
+    a, b = _FakeCalendar("a", [shared]), _SlowCalendar("b", [shared])
+    multi = _multi(a, b)
+    multi.get_upcoming()
+
+    assert multi.delete_event(shared) == f"Deleted event: {shared}"
+    assert (a.deletes, b.deletes) == ([shared], [])
+
+
+def test_parse_event_builds_content_and_metadata():
+    cal = GoogleCalendar(token_path=Path("token.json"))
+    event = {
+        "id": "e1",
+        "summary": "Standup",
+        "start": {"date": "2026-05-16"},
+        "end": {"date": "2026-05-17"},
+        "location": "Room 1",
+        "description": "Agenda",
+        "attendees": [{"email": "a@example.com"}, {}],
+        "organizer": {"email": "team@example.com"},
+    }
+
+    item = cal._parse_event(event)
+
+    assert item.source_id == "e1"
+    assert item.content == "Time: 2026-05-16 (all day)\nLocation: Room 1\n\nAgenda"
+    assert item.metadata["attendees"] == ["a@example.com", ""]
+    assert item.metadata["calendar_id"] == "team@example.com"
+    assert cal._parse_event({"description": "Only notes"}).content == "\nOnly notes"
+
+
+def test_parse_event_metadata_times_match_isoformat():
+    cal = GoogleCalendar(token_path=Path("token.json"))
+    for start_raw in ("2026-05-16T09:30:00+02:00", "2026-05-16T09:30:00Z", "2026-05-16T09:30:00.5-07:00"):
+        item = cal._parse_event({"start": {"dateTime": start_raw}, "end": {}})
+        assert item.metadata["start"] == datetime.fromisoformat(start_raw).isoformat()
+        assert item.metadata["end"] == ""
+    all_day = cal._parse_event({"start": {"date": "2026-05-16"}})
+    assert all_day.metadata["start"] == "2026-05-16T00:00:00+00:00"
@@ -40,6 +40,56 @@ async def test_config_service_rolls_back_nested_settings_and_reloads_runtime(mon
     ]
 
 
+@pytest.mark.asyncio
+async def test_config_service_restores_snapshot_when_save_fails(monkeypatch):
+    import ntrp.services.config as config_module
+
+    persisted = {"provider_keys": {"openai": "old-key"}}
+    reloads: list[dict] = []
+
+    def save_settings(settings: dict) -> None:
+        nonlocal persisted
+        if settings != {"provider_keys": {"openai": "old-key"}}:
+            persisted = {}
+            raise OSError("disk full")
+        persisted = deepcopy(settings)
+
+    async def reload_config() -> None:
+        reloads.append(deepcopy(persisted))
+
+    monkeypatch.setattr(config_module, "load_user_settings", lambda: deepcopy(persisted))
+    monkeypatch.setattr(config_module, "save_user_settings", save_settings)
+
+    service = ConfigService(on_config_change=reload_config)
+
+    with pytest.raises(OSError, match="disk full"):
+        await service.connect_provider("openai", "new-key")
+
+    assert persisted == {"provider_keys": {"openai": "old-key"}}
+    assert reloads == [{"provider_keys": {"openai": "old-key"}}]
+
+
+@pytest.mark.asyncio
+async def test_config_service_skips_save_and_reload_for_unchanged_settings(monkeypatch):
+    import ntrp.services.config as config_module
+
+    persisted = {"chat_model": "gpt-5", "provider_keys": {"openai": "key"}}
+    saves: list[dict] = []
+    reloads: list[None] = []
+
+    async def reload_config() -> None:
+        reloads.append(None)
+
+    monkeypatch.setattr(config_module, "load_user_settings", lambda: deepcopy(persisted))
+    monkeypatch.setattr(config_module, "save_user_settings", saves.append)
+
+    service = ConfigService(on_config_change=reload_config)
+    await service.update(chat_model="gpt-5")
+
+    assert saves == []
+    assert reloads == []
+
+
 @pytest.mark.asyncio
 async def test_config_service_creates_custom_model_and_stores_api_key(monkeypatch):
     import ntrp.services.config as config_module
@@ -150,3 +200,34 @@ async def test_config_service_deletes_custom_model_and_clears_active_fields(monk
         "model_reasoning_efforts": {"other": "low"},
     }
     assert reload_seen == [persisted]
+
+
+@pytest.mark.asyncio
+async def test_config_service_reloads_after_deleting_keyless_inactive_custom_model(monkeypatch):
+    import ntrp.services.config as config_module
+
+    model = Model(
+        id="local/test",
+        provider=Provider.CUSTOM,
+        max_context_tokens=8192,
+        max_output_tokens=2048,
+        base_url="http://localhost:11434/v1",
+    )
+    persisted = {"chat_model": "gpt-5"}
+    removed: list[str] = []
+    reloads: list[None] = []
+
+    async def reload_config() -> None:
+        reloads.append(None)
+
+    monkeypatch.setattr(config_module, "load_user_settings", lambda: deepcopy(persisted))
+    monkeypatch.setattr(config_module, "save_user_settings", lambda settings: None)
+    monkeypatch.setattr(config_module, "get_models_by_provider", lambda _provider: {"local/test": model})
+    monkeypatch.setattr(config_module, "remove_custom_model", removed.append)
+
+    service = ConfigService(on_config_change=reload_config)
+    await service.delete_custom_model("local/test", active_models={"chat_model": "gpt-5"})
+
+    # Settings are untouched, but models.json changed: the runtime must reload.
+    assert removed == ["local/test"]
+    assert reloads == [None]
@@ -0,0 +1,352 @@
+import base64
+import threading
+from datetime import UTC, datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from ntrp.integrations.gmail import client
+from ntrp.integrations.gmail.client import (
+    GmailSource,
+    MultiGmailSource,
+    SourceItem,
+    decode_base64_body,
+    decode_email_header,
+    extract_headers,
+    find_email_parts,
+    html_to_plain,
+    parse_email_date,
+)
+from ntrp.integrations.google_auth.accounts import AccountIndex
+
+
+@pytest.fixture(autouse=True)
+def _message_cache_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(client, "MESSAGE_CACHE_PATH", tmp_path / "emails_cache.db")
+
+
+def _b64(text: str) -> str:
+    return base64.urlsafe_b64encode(text.encode()).decode()
+
+
+def test_decode_base64_body_handles_urlsafe_and_invalid_data():
+    assert decode_base64_body(_b64("héllo ~~?>")) == "héllo ~~?>"
+    assert decode_base64_body("!!!") == ""
+    assert decode_base64_body(_b64("hi").rstrip("=")) == "hi"
+    assert decode_base64_body("a") == decode_base64_body("") == ""
+
+
+def test_find_email_parts_collects_nested_plain_and_html():
+    payload = {
+        "mimeType": "multipart/mixed",
+        "parts": [
+            {
+                "mimeType": "multipart/alternative",
+                "parts": [
+                    {"mimeType": "text/plain", "body": {"data": _b64("plain body")}},
+                    {"mimeType": "text/html", "body": {"data": _b64("<p>html body</p>")}},
+                ],
+            },
+            {"mimeType": "application/pdf", "body": {"attachmentId": "a1"}},
+            {"mimeType": "text/plain", "body": {"data": _b64(" + footer")}},
+        ],
+    }
+
+    assert find_email_parts(payload) == ("plain body + footer", "<p>html body</p>")
+    assert find_email_parts(payload, html_fallback_only=True) == ("plain body + footer", "")
+
+
+def test_html_to_plain_strips_markup_and_normalizes_whitespace():
+    html = (
+        "<html><head><STYLE>p { color: red }</STYLE><script type='x'>alert('<b>')</script></head>"
+        "<body><p>Hello\t\t <b>world</b></p><p></p><p></p>Line<BR/>next &amp; last<br>\n\n\n\nend</body></html>"
+    )
+
+    assert html_to_plain(html) == "Hello world\n\nLine\nnext & last\n\nend"
+    assert html_to_plain("") == ""
+
+
+def test_has_send_scope_is_cached_until_credentials_change(monkeypatch):
+    creds = SimpleNamespace(valid=True, scopes=["https://www.googleapis.com/auth/gmail.send"])
+    monkeypatch.setattr(client, "get_google_credentials", lambda *a, **kw: creds)
+    checks = []
+    monkeypatch.setattr(client, "has_scope", lambda c, scope: checks.append(scope) or scope in c.scopes)
+    src = GmailSource(token_path=Path("token.json"))
+
+    assert src.has_send_scope() and src.has_send_scope()
+    assert len(checks) == 1
+
+    creds.valid = False
+    assert src.has_send_scope()
+    assert len(checks) == 2
+
+
+class _FakeBatch:
+    def __init__(self, service, callback):
+        self._service = service
+        self._callback = callback
+        self._ids: list[str] = []
+
+    def add(self, request, request_id: str) -> None:
+        self._ids.append(request_id)
+
+    def execute(self) -> None:
+        self._service.batches.append(self._ids)
+        for msg_id in self._ids:
+            if msg_id == "gone":
+                self._callback(msg_id, None, RuntimeError("404"))
+            else:
+                self._callback(msg_id, {"id": msg_id, "snippet": f"snippet {msg_id}"}, None)
+
+
+class _FakeGmailService:
+    def __init__(self, ids: list[str]):
+        self.ids = ids
+        self.batches: list[list[str]] = []
+
+    def users(self):
+        return self
+
+    def messages(self):
+        return self
+
+    def list(self, **kwargs):
+        return SimpleNamespace(execute=lambda: {"messages": [{"id": i} for i in self.ids]})
+
+    def get(self, **kwargs):
+        return kwargs
+
+    def new_batch_http_request(self, callback):
+        return _FakeBatch(self, callback)
+
+
+def test_search_fetches_uncached_metadata_in_batches(monkeypatch):
+    monkeypatch.setattr(client, "_METADATA_BATCH_SIZE", 2)
+    src = GmailSource(token_path=Path("token.json"))
+    src._service = service = _FakeGmailService(["m1", "gone", "m2", "m3"])
+
+    assert [item.source_id for item in src.search("from:me")] == ["m1", "m2", "m3"]
+    assert service.batches == [["m1", "gone"], ["m2", "m3"]]
+
+    service.ids = ["m3", "m4"]
+    assert [item.content for item in src.search("from:me")] == ["snippet m3", "snippet m4"]
+    assert service.batches[-1] == ["m4"]
+
+
+def test_message_cache_survives_restart_and_is_scoped_per_account():
+    src = GmailSource(token_path=Path("token.json"))
+    src._service = _FakeGmailService(["m1", "m2"])
+    src.search("from:me")
+    src._full_cache.put("m1", {"id": "m1", "snippet": "full"})
+    src._store.put_many("full", {"m1": {"id": "m1", "snippet": "full"}})
+
+    restarted = GmailSource(token_path=Path("token.json"))
+    restarted._service = service = _FakeGmailService(["m2", "m1"])
+    assert [item.content for item in restarted.search("from:me")] == ["snippet m2", "snippet m1"]
+    assert restarted._fetch_message_full("m1") == {"id": "m1", "snippet": "full"}
+    assert service.batches == []
+
+    other = GmailSource(token_path=Path("other.json"))
+    other._service = service = _FakeGmailService(["m1"])
+    other.search("from:me")
+    assert service.batches == [["m1"]]
+
+
+def test_message_store_is_private_and_purges_expired_and_excess_rows(monkeypatch):
+    monkeypatch.setattr(client, "_MESSAGE_CACHE_MAX_ROWS", 2)
+    store = client._MessageStore(client.MESSAGE_CACHE_PATH, "token.json")
+    store.put_many("meta", {"m1": {"id": "m1"}, "m2": {"id": "m2"}})
+    store._connect().execute("UPDATE emails SET fetched_at = 0 WHERE key = 'token.json:meta:m1'")
+    store.put_many("meta", {"m3": {"id": "m3"}, "m4": {"id": "m4"}})
+
+    reopened = client._MessageStore(client.MESSAGE_CACHE_PATH, "token.json")
+    reopened._connect()
+
+    assert client.MESSAGE_CACHE_PATH.stat().st_mode & 0o777 == 0o600
+    assert reopened._conn.execute("SELECT count(*) FROM emails").fetchone() == (2,)
+    assert reopened.get_many("meta", ["m1"]) == {}
+
+
+async def test_removing_account_deletes_its_cached_messages(tmp_path, monkeypatch):
+    from ntrp.server.routers import gmail as gmail_router
+
+    monkeypatch.setattr(gmail_router, "NTRP_DIR", tmp_path)
+    token = tmp_path / "gmail_token.json"
+    token.write_text("{}")
+    for name in ("gmail_token.json", "gmail_token_b.json"):
+        client._MessageStore(client.MESSAGE_CACHE_PATH, name).put_many("full", {"m1": {"id": "m1"}})
+    syncs: list[None] = []
+
+    async def sync_google_sources() -> None:
+        syncs.append(None)
+
+    result = await gmail_router.gmail_remove(
+        "gmail_token.json", SimpleNamespace(sync_google_sources=sync_google_sources)
+    )
+
+    assert result["status"] == "removed" and not token.exists() and syncs == [None]
+    assert client._MessageStore(client.MESSAGE_CACHE_PATH, "gmail_token.json").get_many("full", ["m1"]) == {}
+    assert client._MessageStore(client.MESSAGE_CACHE_PATH, "gmail_token_b.json").get_many("full", ["m1"]) == {
+        "m1": {"id": "m1"}
+    }
+
+
+class _FakeAccount:
+    def __init__(self, name: str, days: list[int], barrier: threading.Barrier):
+        self.token_path = Path(f"{name}.json")
+        self._email_address = None
+        self._days = days
+        self._barrier = barrier
+
+    def get_email_address(self) -> str:
+        return f"{self.token_path.stem}@example.com"
+
+    def list_recent(self, days: int, limit: int) -> list[SourceItem]:
+        self._barrier.wait(timeout=5)
+        if not self._days:
+            raise RuntimeError("quota")
+        return [
+            SourceItem(
+                identity=f"{self.token_path.stem}{d}",
+                title="",
+                source="gmail",
+                timestamp=datetime(2026, 5, d, tzinfo=UTC),
+            )
+            for d in self._days
+        ]
+
+
+def test_multi_gmail_list_recent_fans_out_accounts_concurrently():
+    barrier = threading.Barrier(3)
+    multi = MultiGmailSource.__new__(MultiGmailSource)
+    multi.sources = [
+        _FakeAccount("a", [1, 3], barrier),
+        _FakeAccount("b", [2], barrier),
+        _FakeAccount("c", [], barrier),
+    ]
+    multi._errors = {}
+
+    assert [item.identity for item in multi.list_recent(limit=10)] == ["a3", "b2", "a1"]
+    assert multi.errors == {"c@example.com": "quota"}
+    assert [item.identity for item in multi.list_recent(limit=2)] == ["a3", "b2"]
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = client._LRUCache(maxsize=2)
+    cache.put("a", {"id": "a"})
+    cache.put("b", {"id": "b"})
+    assert cache.get("a") == {"id": "a"}
+
+    cache.put("c", {"id": "c"})
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c"), len(cache)) == ({"id": "a"}, {"id": "c"}, 2)
+
+
+def test_parse_full_message_prefers_plain_then_html_then_snippet():
+    src = GmailSource(token_path=Path("token.json"))
+
+    def message(*parts: tuple[str, str]) -> dict:
+        return {
+            "id": "m1",
+            "snippet": "snip",
+            "internalDate": "0",
+            "payload": {
+                "mimeType": "multipart/alternative",
+                "parts": [{"mimeType": mime, "body": {"data": _b64(text)}} for mime, text in parts],
+            },
+        }
+
+    assert src._parse_full_message(message(("text/plain", "  hi \n"), ("text/html", "<p>x</p>"))).content == "hi"
+    assert src._parse_full_message(message(("text/plain", " \n"), ("text/html", "<p>x</p>"))).content == "x"
+    assert src._parse_full_message(message()).content == "snip"
+
+
+def test_extract_headers_keeps_only_wanted_names():
+    headers = [
+        {"name": "Received", "value": "from mx"},
+        {"name": "SUBJECT", "value": "Hi"},
+        {"name": "From", "value": "a@example.com"},
+        {"name": "Date", "value": "Sat, 16 May 2026 09:30:00 +0200"},
+    ]
+
+    parsed = extract_headers(headers)
+
+    assert parsed == {"subject": "Hi", "from": "a@example.com", "date": "Sat, 16 May 2026 09:30:00 +0200"}
+    assert parse_email_date(parsed["date"], 0) == datetime(2026, 5, 16, 7, 30, tzinfo=UTC)
+    assert parse_email_date(None, 1_000) == datetime(1970, 1, 1, 0, 0, 1, tzinfo=UTC)
+
+
+def test_markdown_to_html_reuses_converter_without_leaking_state():
+    src = GmailSource(token_path=Path("token.json"))
+
+    first = src._markdown_to_html("Note[^1]\n\n[^1]: footnote text")
+    second = src._markdown_to_html("**plain**")
+
+    assert "footnote text" in first
+    assert "<strong>plain</strong>" in second and "footnote" not in second
+    assert client._markdown_converter() is client._markdown_converter()
+
+
+def test_parse_email_date_fast_path_matches_rfc2822_parser():
+    plus_two = datetime(2026, 5, 16, 7, 30, tzinfo=UTC)
+    assert parse_email_date("16 May 2026 09:30:00 +0200 (CEST)", 0) == plus_two
+    assert parse_email_date("Sat, 16 May 2026 09:30:00 -0000", 0).utcoffset().total_seconds() == 0
+    # Shapes outside the fast path still go through email.utils
+    assert parse_email_date("Sat, 16 May 2026 07:30 GMT", 0) == plus_two
+    assert parse_email_date("16 May 26 09:30 +0200", 0) == plus_two
+
+
+def test_decode_email_header_handles_plain_and_encoded_words():
+    assert decode_email_header("  Plain subject ") == "Plain subject"
+    assert decode_email_header("=?utf-8?Q?Caf=C3=A9?= menu") == "Café menu"
+    assert decode_email_header(None) == ""
+
+
+def test_multi_gmail_send_email_dispatches_by_address():
+    sent = []
+
+    class Account(SimpleNamespace):
+        def get_email_address(self) -> str:
+            return self.email
+
+        def send(self, **kwargs) -> str:
+            sent.append((self.email, kwargs["from_email"]))
+            return "Sent"
+
+    multi = MultiGmailSource.__new__(MultiGmailSource)
+    multi.sources = [Account(email=e, _email_address=e) for e in ("a@example.com", "B@example.com")]
+    multi._accounts = AccountIndex(multi.sources)
+
+    assert multi.send_email(account=" b@EXAMPLE.com", to="x@example.com", subject="s", body="b") == "Sent"
+    assert sent == [("B@example.com", " b@EXAMPLE.com")]
+    assert multi.send_email(account="c@example.com", to="x", subject="s", body="b").startswith("Error: account not")
+
+
+def test_send_encodes_message_as_urlsafe_base64(monkeypatch):
+    sent = {}
+
+    class Service:
+        def users(self):
+            return self
+
+        def messages(self):
+            return self
+
+        def send(self, userId: str, body: dict):
+            sent.update(body)
+            return SimpleNamespace(execute=lambda: {"id": "s1"})
+
+    src = GmailSource(token_path=Path("token.json"))
+    src._service = Service()
+    monkeypatch.setattr(src, "has_send_scope", lambda: True)
+
+    assert src.send(to="x@example.com", subject="Hi ÿ", body="ü" * 100) == "Sent email to x@example.com (id: s1)"
+    assert isinstance(sent["raw"], str)
+    assert b"to: x@example.com" in base64.urlsafe_b64decode(sent["raw"])
+
+
+def test_json_model_parses_bytes_and_passes_through_non_json():
+    assert client._JSON_MODEL.deserialize(b'{"id": "m1", "snippet": "caf\xc3\xa9"}') == {"id": "m1", "snippet": "café"}
+    assert client._JSON_MODEL.deserialize(b"not json") == "not json"
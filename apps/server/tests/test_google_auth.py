@@ -0,0 +1,131 @@
+import json
+import os
+from datetime import UTC, datetime, timedelta
+
+from ntrp.integrations.google_auth import auth
+from ntrp.integrations.google_auth.accounts import AccountIndex
+
+
+def _write_token(path, token: str) -> None:
+    expiry = (datetime.now(UTC) + timedelta(hours=1)).replace(tzinfo=None).isoformat()
+    path.write_text(
+        json.dumps(
+            {
+                "token": token,
+                "refresh_token": "refresh",
+                "client_id": "client",
+                "client_secret": "secret",
+                "scopes": auth.SCOPES_ALL,
+                "expiry": expiry,
+            }
+        )
+    )
+
+
+def test_get_google_credentials_reuses_credentials_until_token_file_changes(tmp_path):
+    token_path = tmp_path / "gmail_token_me@example.com.json"
+    _write_token(token_path, "first")
+
+    creds = auth.get_google_credentials(token_path)
+    assert auth.get_google_credentials(token_path) is creds
+    assert creds.token == "first"
+
+    _write_token(token_path, "second")
+    stat = token_path.stat()
+    os.utime(token_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    reloaded = auth.get_google_credentials(token_path)
+    assert reloaded is not creds
+    assert reloaded.token == "second"
+
+
+def test_discover_tokens_matches_prefix_and_json_suffix(tmp_path, monkeypatch):
+    monkeypatch.setattr(auth, "NTRP_DIR", tmp_path)
+    for name in (
+        "gmail_token_b@example.com.json",
+        "gmail_token_a@example.com.json",
+        "calendar_token.json",
+        "gmail_token_backup.txt",
+        "settings.json",
+    ):
+        (tmp_path / name).write_text("{}")
+    (tmp_path / "gmail_token_dir.json").mkdir()
+
+    assert [p.name for p in auth.discover_gmail_tokens()] == [
+        "gmail_token_a@example.com.json",
+        "gmail_token_b@example.com.json",
+    ]
+    assert [p.name for p in auth.discover_calendar_tokens()] == [
+        "calendar_token.json",
+        "gmail_token_a@example.com.json",
+        "gmail_token_b@example.com.json",
+    ]
+
+
+def test_discover_tokens_rescans_only_when_dir_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(auth, "NTRP_DIR", tmp_path)
+    (tmp_path / "gmail_token_a@example.com.json").write_text("{}")
+    scans = 0
+    real_scandir = auth.os.scandir
+
+    def counting_scandir(path):
+        nonlocal scans
+        scans += 1
+        return real_scandir(path)
+
+    monkeypatch.setattr(auth.os, "scandir", counting_scandir)
+
+    assert [p.name for p in auth.discover_gmail_tokens()] == ["gmail_token_a@example.com.json"]
+    assert [p.name for p in auth.discover_gmail_tokens()] == ["gmail_token_a@example.com.json"]
+    assert scans == 1
+
+    (tmp_path / "gmail_token_b@example.com.json").write_text("{}")
+    os.utime(tmp_path, ns=(0, tmp_path.stat().st_mtime_ns + 1))
+
+    assert [p.name for p in auth.discover_gmail_tokens()] == [
+        "gmail_token_a@example.com.json",
+        "gmail_token_b@example.com.json",
+    ]
+    assert scans == 2
+
+
+def test_discover_tokens_handles_missing_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(auth, "NTRP_DIR", tmp_path / "missing")
+
+    assert auth.discover_gmail_tokens() == []
+    assert auth.discover_calendar_tokens() == []
+
+
+class _Account:
+    def __init__(self, email: str | None):
+        self._email = email
+        self._email_address = None
+        self.lookups = 0
+
+    def get_email_address(self) -> str:
+        self.lookups += 1
+        if self._email is None:
+            return ""  # lookup failed; stays unresolved
+        self._email_address = self._email
+        return self._email
+
+
+def test_account_index_caches_map_when_token_files_share_an_address():
+    # Same account discovered via both a calendar_token and a gmail_token file.
+    first, second = _Account("Me@example.com"), _Account("me@example.com")
+    index = AccountIndex([first, second])
+
+    assert index.by_email() == {"me@example.com": first}
+    index.by_email()
+    assert (first.lookups, second.lookups) == (1, 1)
+
+
+def test_account_index_retries_until_every_address_resolves():
+    flaky = _Account(None)
+    index = AccountIndex([_Account("a@example.com"), flaky])
+
+    assert list(index.by_email()) == ["a@example.com"]
+    flaky._email = "b@example.com"
+    assert list(index.by_email()) == ["a@example.com", "b@example.com"]
+    index.by_email()
+    assert flaky.lookups == 2
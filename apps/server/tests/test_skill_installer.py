@@ -0,0 +1,108 @@
+import io
+import tarfile
+
+import httpx
+import pytest
+
+from ntrp.skills import installer
+
+_TREE = {
+    "truncated": False,
+    "tree": [
+        {"path": "pkg", "type": "tree"},
+        {"path": "pkg/helper", "type": "tree"},
+        {"path": "pkg/helper/SKILL.md", "type": "blob", "size": 10},
+        {"path": "pkg/helper/assets", "type": "tree"},
+        {"path": "pkg/helper/assets/notes.txt", "type": "blob", "size": 5},
+        {"path": "pkg/helper-extra/SKILL.md", "type": "blob", "size": 5},
+        {"path": "README.md", "type": "blob", "size": 6},
+    ],
+}
+_FILES = {
+    "/acme/skills/main/pkg/helper/SKILL.md": b"---\nname: helper\ndescription: Helps\n---\n",
+    "/acme/skills/main/pkg/helper/assets/notes.txt": b"notes",
+}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.host == "api.github.com":
+        if request.url.path == "/repos/acme/skills":
+            return httpx.Response(200, json={"default_branch": "main"})
+        if request.url.path == "/repos/acme/skills/git/trees/main" and request.url.params["recursive"] == "1":
+            return httpx.Response(200, json=_TREE)
+    if request.url.host == "raw.githubusercontent.com" and request.url.path in _FILES:
+        return httpx.Response(200, content=_FILES[request.url.path])
+    return httpx.Response(404)
+
+
+@pytest.fixture
+def mock_github(monkeypatch):
+    real_client = httpx.AsyncClient
+
+    def client(**kwargs):
+        return real_client(transport=httpx.MockTransport(_handler), **kwargs)
+
+    monkeypatch.setattr(installer.httpx, "AsyncClient", client)
+
+
+@pytest.mark.asyncio
+async def test_install_from_github_downloads_nested_files_from_tree(tmp_path, mock_github):
+    name = await installer.install_from_github("acme/skills/pkg/helper", tmp_path)
+
+    assert name == "helper"
+    assert sorted(p.relative_to(tmp_path).as_posix() for p in tmp_path.rglob("*") if p.is_file()) == [
+        "helper/SKILL.md",
+        "helper/assets/notes.txt",
+    ]
+    assert (tmp_path / "helper" / "SKILL.md").read_bytes() == _FILES["/acme/skills/main/pkg/helper/SKILL.md"]
+    assert (tmp_path / "helper" / "assets" / "notes.txt").read_bytes() == b"notes"
+
+
+@pytest.mark.asyncio
+async def test_install_from_github_cleans_up_on_missing_source(tmp_path, mock_github):
+    with pytest.raises(ValueError, match="Not found"):
+        await installer.install_from_github("acme/skills/pkg/missing", tmp_path)
+
+    assert not (tmp_path / "missing").exists()
+
+
+def _tarball(files: dict[str, bytes]) -> bytes:
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+        for name, data in files.items():
+            info = tarfile.TarInfo(f"acme-skills-abc123/{name}")
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return buf.getvalue()
+
+
+@pytest.mark.asyncio
+async def test_install_from_github_extracts_subtree_from_tarball(tmp_path, monkeypatch):
+    archive = _tarball(
+        {
+            "pkg/helper/SKILL.md": _FILES["/acme/skills/main/pkg/helper/SKILL.md"],
+            "pkg/helper/assets/notes.txt": b"notes",
+            "pkg/other/SKILL.md": b"other",
+            "README.md": b"readme",
+        }
+    )
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        if request.url.path == "/repos/acme/skills/tarball/HEAD":
+            return httpx.Response(200, content=archive)
+        return httpx.Response(404)
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        installer.httpx, "AsyncClient", lambda **kw: real_client(transport=httpx.MockTransport(handler), **kw)
+    )
+
+    await installer.install_from_github("acme/skills/pkg/helper", tmp_path)
+
+    assert requested == ["/repos/acme/skills/tarball/HEAD"]
+    assert sorted(p.relative_to(tmp_path).as_posix() for p in tmp_path.rglob("*") if p.is_file()) == [
+        "helper/SKILL.md",
+        "helper/assets/notes.txt",
+    ]
@@ -1,9 +1,11 @@
+import os
 from pathlib import Path
 
 from fastapi.testclient import TestClient
 
 from ntrp.server.app import app
 from ntrp.server.deps import require_skill_service
+from ntrp.skills import service as service_module
 from ntrp.skills.registry import SkillRegistry
 from ntrp.skills.service import SkillService, get_skills_dirs
 
@@ -78,6 +80,71 @@ def test_registry_renders_skill_xml_with_arguments(tmp_path):
     assert "ARGUMENTS: Current user request: audit it" in rendered
 
 
+def test_registry_reload_reuses_untouched_skills_and_rereads_edited_ones(tmp_path):
+    _write_skill(tmp_path, "stable", "name: stable\ndescription: Stable\n", body="# Stable\n")
+    _write_skill(tmp_path, "edited", "name: edited\ndescription: Edited\n", body="# Before\n")
+    registry = SkillRegistry()
+    registry.load([(tmp_path, "project")])
+    stable = registry.get("stable")
+
+    skill_md = tmp_path / "edited" / "SKILL.md"
+    skill_md.write_text("---\nname: edited\ndescription: Edited\n---\n\n# After\n")
+    stat = skill_md.stat()
+    os.utime(skill_md, (stat.st_atime, stat.st_mtime + 10))
+    registry.reload([(tmp_path, "project")])
+
+    assert registry.get("stable") is stable
+    assert registry.load_body("stable") == "# Stable"
+    assert registry.load_body("edited") == "# After"
+
+
+def test_registry_derived_views_are_cached_until_skills_change(tmp_path):
+    _write_skill(tmp_path, "first", "name: first\ndescription: First\n")
+    registry = SkillRegistry()
+    registry.load([(tmp_path, "project")])
+
+    version = registry.version
+    xml = registry.to_prompt_xml()
+    assert registry.to_prompt_xml() is xml
+    assert "<name>first</name>" in xml
+
+    _write_skill(tmp_path, "second", "name: second\ndescription: Second\n")
+    registry.reload([(tmp_path, "project")])
+    assert registry.version == version + 1
+    assert "<name>second</name>" in registry.to_prompt_xml()
+
+    assert registry.names == ("first", "second")
+    assert registry.names_csv == "first, second"
+
+    registry.remove("second")
+    assert registry.version == version + 2
+    assert "<name>second</name>" not in registry.to_prompt_xml()
+    assert [meta.name for meta in registry.list_all()] == ["first"]
+    assert registry.names_csv == "first"
+
+
+async def test_skill_service_remove_deletes_files_and_keeps_concurrent_reloads(tmp_path, monkeypatch):
+    _write_skill(tmp_path, "first", "name: first\ndescription: First\n")
+    _write_skill(tmp_path, "second", "name: second\ndescription: Second\n")
+    registry = SkillRegistry()
+    registry.load([(tmp_path, "project")])
+    service = SkillService(registry)
+
+    real_rmtree = service_module.shutil.rmtree
+
+    def rmtree_during_install(path, **kwargs):
+        _write_skill(tmp_path, "third", "name: third\ndescription: Third\n")
+        registry.reload([(tmp_path, "project")])
+        real_rmtree(path, **kwargs)
+
+    monkeypatch.setattr(service_module.shutil, "rmtree", rmtree_during_install)
+
+    assert await service.remove("first")
+    assert not (tmp_path / "first").exists()
+    assert registry.names == ("second", "third")
+    assert not await service.remove("missing")
+
+
 def test_skill_service_governance_report_marks_cleanup_candidates(tmp_path):
     _write_skill(
         tmp_path,
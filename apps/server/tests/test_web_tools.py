@@ -1,4 +1,5 @@
 from datetime import UTC, datetime
+from types import SimpleNamespace
 
 import pytest
 from ddgs.exceptions import DDGSException
@@ -6,6 +7,7 @@ from ddgs.exceptions import DDGSException
 from ntrp.context.models import SessionState
 from ntrp.integrations.web import ddgs as ddgs_module
 from ntrp.integrations.web.ddgs import DDGSWebSource
+from ntrp.integrations.web.exa import ExaWebSource
 from ntrp.integrations.web.exceptions import NoSearchResultsException, WebSearchProviderException
 from ntrp.integrations.web.tools import WebFetchInput, WebSearchInput, web_fetch, web_search
 from ntrp.integrations.web.types import WebContentResult, WebSearchResult
@@ -165,3 +167,21 @@ def test_ddgs_web_source_raises_provider_exception_for_request_failures(monkeypa
 
     with pytest.raises(WebSearchProviderException, match="DuckDuckGo request failed"):
         DDGSWebSource().search_with_details("normal query", 5, None)
+
+
+def test_exa_get_contents_chunks_large_url_lists_and_keeps_order():
+    calls: list[list[str]] = []
+
+    class FakeExa:
+        def get_contents(self, urls, text):
+            calls.append(list(urls))
+            return SimpleNamespace(results=[SimpleNamespace(url=url, title=None, text=url) for url in urls])
+
+    source = ExaWebSource(api_key="key")
+    source._client = FakeExa()
+    urls = [f"https://example.com/{i}" for i in range(25)]
+
+    results = source.get_contents(urls)
+
+    assert [r.url for r in results] == urls
+    assert sorted(len(chunk) for chunk in calls) == [5, 10, 10]